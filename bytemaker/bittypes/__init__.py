@@ -1,4 +1,9 @@
-from bytemaker.bittypes.bittype import BitType, StructPackedBitType, bytes_to_bittype
+from bytemaker.bittypes.bittype import (
+    BitType,
+    StructPackedBitType,
+    bittypes_to_bytes,
+    bytes_to_bittype,
+)
 from bytemaker.bittypes.buffer import (
     Buffer,
     Buffer1,
@@ -131,6 +136,7 @@ __all__ = [
     "BitType",
     "StructPackedBitType",
     "bytes_to_bittype",
+    "bittypes_to_bytes",
     "Buffer",
     "Buffer1",
     "Buffer2",
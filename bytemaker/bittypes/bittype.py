@@ -3,16 +3,24 @@ from __future__ import annotations
 import operator
 import struct
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from inspect import getattr_static
 from typing import TYPE_CHECKING
 
+from bitarray import bitarray
+
 from bytemaker.bitvector import BitVector
 from bytemaker.typing_redirect import (
     Any,
     Callable,
+    Dict,
     Final,
     Generic,
+    Iterable,
+    List,
     Literal,
     Optional,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -30,6 +38,34 @@ else:
     except ImportError:
         BitSelf = TypeVar("BitSelf", bound="BitType")
 
+_new_bitarray = bitarray.__new__
+"""
+`bitarray.__new__`, for wrapping packed bytes as `_new_bitarray(BitVector, buffer=b)`
+    without going through BitVector's Python-level constructor dispatch.
+"""
+
+
+@lru_cache(maxsize=256)
+def _source_kind(source_type: type) -> Literal["bittype", "bits", "value"]:
+    """
+    Classifies the type of a `BitType` constructor's `source` argument.
+    Memoized per type, so repeated constructions skip the (ABC) isinstance checks.
+    The cache is bounded, since it holds strong references to the types,
+        which may be created dynamically (e.g. by `specialize`).
+
+    Args:
+        source_type (type): The type of the `source` argument.
+
+    Returns:
+        Literal["bittype", "bits", "value"]: Whether the source is a BitType,
+            a BitVector, or a (Pythonic) value.
+    """
+    if issubclass(source_type, BitType):
+        return "bittype"
+    elif issubclass(source_type, BitVector):
+        return "bits"
+    return "value"
+
 
 class BitType(ABC, Generic[T]):
     """
@@ -56,12 +92,17 @@ class BitType(ABC, Generic[T]):
     :vartype endianness: Literal["big", "little"]
     """
 
+    __slots__ = ("_bits", "_endianness")
+
     _num_bits: Final[int]
     base_bit_type: Final[Type[BitType]]
     """The base BitType this class derives from (e.g. UInt for UInt8)."""
     py_type: Final[Type[T]]  # type: ignore[reportGeneralTypeIssue]
     """The Pythonic type that this BitType can be converted to/from."""
 
+    _specializations: Dict[Tuple[Any, ...], Type[BitType]]
+    """The cache of subclasses previously produced by this class's `specialize`."""
+
     _bits: BitVector
     _endianness: Literal["big", "little"]
 
@@ -73,7 +114,8 @@ class BitType(ABC, Generic[T]):
         endianness: Literal["big", "little", "source_else_big"] = "source_else_big",
     ):
         if source is not None:
-            if isinstance(source, BitType):
+            source_kind = _source_kind(type(source))
+            if source_kind == "bittype":
                 try:
                     value = self.py_type(source.value)  # type: ignore[reportCallIssue]
                     assert isinstance(value, self.py_type)
@@ -83,9 +125,9 @@ class BitType(ABC, Generic[T]):
                         f" due to error: {e}"
                     )
                 if endianness == "source_else_big":
-                    endianness = source.endianness
+                    endianness = source._endianness
 
-            elif isinstance(source, BitVector):
+            elif source_kind == "bits":
                 bits = source
             else:
                 try:
@@ -110,6 +152,31 @@ class BitType(ABC, Generic[T]):
         elif bits is not None:
             self.bits = bits
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precomputes per-class constants once, when a BitType subclass is created,
+            so that they don't need to be recomputed on every access.
+
+        Classes whose size is not yet known (e.g. `SInt`) are left untouched.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._specializations = {}
+        num_bits = cls._calculate_num_bits()
+        if num_bits is not None:
+            cls._num_bits = num_bits
+            # Shadows the `num_bits` classproperty with a plain class attribute
+            cls.num_bits = num_bits
+
+    @classmethod
+    def _calculate_num_bits(cls) -> Optional[int]:
+        """
+        Calculates the number of bits in the BitType from its class attributes.
+
+        Returns:
+            Optional[int]: The number of bits, or None if not (yet) determinable.
+        """
+        return getattr(cls, "_num_bits", None)
+
     @property
     def endianness(self) -> Literal["big", "little"]:
         """
@@ -186,13 +253,15 @@ class BitType(ABC, Generic[T]):
         Returns:
             str: ClassName[self.endianness]({self.value} = {self.bitstring})
         """
-        if len(self.bits) < 17:
-            bitstring = self.bits.to01(sep=" ")
+        bits = self._bits
+        if len(bits) < 17:
+            bitstring = bits.to01(sep=" ")
         else:
-            bitstring = self.bits[:8].to01() + "..." + self.bits[-8:].to01()
+            zeros_and_ones = bits.to01()
+            bitstring = zeros_and_ones[:8] + "..." + zeros_and_ones[-8:]
 
         return (
-            f"{self.__class__.__name__}[{self.endianness}]"
+            f"{self.__class__.__name__}[{self._endianness}]"
             f"({self.value} = {bitstring})"
         )
 
@@ -205,7 +274,8 @@ class BitType(ABC, Generic[T]):
             str: ClassName(value)(bits={self.value}, {endianness=self.endianness})
         """
         return (
-            f"{self.__class__.__name__}(bits={self.bits}, endianness={self.endianness})"
+            f"{self.__class__.__name__}"
+            f"(bits={self._bits}, endianness={self._endianness})"
         )
 
     def __eq__(self, other):
@@ -215,16 +285,43 @@ class BitType(ABC, Generic[T]):
         Two bittypes are equal if their values are equal. Note that this means that
         they might have internal bit representations (-0 and +0 are still equal, though)
 
+        Two NaN-valued bittypes of the same class are also considered equal.
+
         Args:
             other (Any): The object to compare to.
 
         Returns:
             bool: True if the objects are equal, False otherwise
         """
+        if self is other:
+            return True
+        if type(other) is type(self):
+            if self._bits == other._bits and self._decodes_like(other):
+                # Identical bits decoded the same way give the same value
+                return True
+            self_value, other_value = self.value, other.value
+            if self_value != self_value and other_value != other_value:
+                # Both values are NaN
+                return True
+            return self_value == other_value
         if isinstance(other, self.__class__):
             return self.value == other.value
         return self.value == other
 
+    def _decodes_like(self: BitSelf, other: BitSelf) -> bool:
+        """
+        Whether this object and another of the same class decode identical bits
+            to the same value, i.e. whether their endianness (and any other
+            per-instance representation state) match.
+
+        Args:
+            other (BitSelf): The object of the same class to compare with.
+
+        Returns:
+            bool: True if identical bits decode the same way for both objects.
+        """
+        return self._endianness == other._endianness
+
     def __ne__(self, other):
         """
         Compares the BitType to another object.
@@ -252,21 +349,49 @@ class BitType(ABC, Generic[T]):
         Returns:
             bytes: The bytes representation of the BitType.
         """
-        temp_bytes = bytes(self.bits)
-        if self.endianness == "big":
+        temp_bytes = self._bits.tobytes()
+        if self._endianness == "big":
             return temp_bytes
         else:
             return temp_bytes[::-1]
 
-    # def __hash__(self):
-    #     """
-    #     Returns the hash of the BitType.
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the bytes representation of the BitType through the buffer protocol
+            (PEP 688, used by Python 3.12+ for e.g. `memoryview(bittype)`).
+
+        For big-endian BitTypes with a whole number of bytes, this is a zero-copy
+            view of the underlying BitVector's memory. Otherwise, it is a view of
+            a `bytes(self)` copy.
 
-    #     Because the only thing that matters is that the value for __eq__,
-    #     the hash is based on just the BitType value.
-    #     """
-    #     # return hash(frozenset([self.__class__, self.value]))
-    #     return hash(frozenset([self.value]))
+        Args:
+            flags (int): The buffer flags requested by the consumer.
+
+        Returns:
+            memoryview: A view of the bytes representation of the BitType.
+        """
+        bits = self._bits
+        if self._endianness == "big" and len(bits) % 8 == 0:
+            return memoryview(bits)
+        return memoryview(bytes(self))
+
+    def __hash__(self):
+        """
+        Returns the hash of the BitType.
+
+        Because the only thing that matters is that the value for __eq__,
+        the hash is based on just the BitType value.
+        Note that BitTypes are mutable, so they shouldn't be mutated
+            while in a set or used as a dict key.
+
+        Returns:
+            int: The hash of the BitType.
+        """
+        value = self.value
+        if value != value:
+            # NaN values of the same class are equal, so they must share a hash
+            return hash((self.__class__, "nan"))
+        return hash(value)
 
     # Temporary methods
     # TODO remove
@@ -279,7 +404,7 @@ class BitType(ABC, Generic[T]):
         Returns:
             BitVector: The sequence of bits of the BitType.
         """
-        return self.bits
+        return self._bits
 
     @classmethod
     def from_bits(cls, bits: BitVector):
@@ -294,6 +419,122 @@ class BitType(ABC, Generic[T]):
         """
         return cls(bits=bits)
 
+    @classmethod
+    def _new_from_bits(
+        cls: Type[BitSelf],
+        bits: BitVector,
+        endianness: Literal["big", "little"] = "big",
+    ) -> BitSelf:
+        """
+        Creates a new BitType object directly from a BitVector, bypassing `__init__`.
+
+        No conversion or validation is performed;
+            the caller is responsible for `bits` having `num_bits` bits.
+
+        Args:
+            bits (BitVector): The sequence of bits the object should use (not copied).
+            endianness (Literal["big", "little"]): The endianness of the object.
+
+        Returns:
+            BitSelf: The new BitType object.
+        """
+        self = cls.__new__(cls)
+        self._bits = bits
+        self._endianness = endianness
+        return self
+
+    @classmethod
+    def _new_from_value(
+        cls: Type[BitSelf],
+        value: T,
+        endianness: Literal["big", "little"] = "big",
+    ) -> BitSelf:
+        """
+        Creates a new BitType object directly from a (Pythonic) value,
+            bypassing `__init__`'s source dispatch.
+
+        The caller is responsible for `value` already being a `py_type`.
+
+        Args:
+            value (T): The value of the object, encoded through the `value` setter.
+            endianness (Literal["big", "little"]): The endianness of the object.
+
+        Returns:
+            BitSelf: The new BitType object.
+        """
+        self = cls.__new__(cls)
+        self._endianness = endianness
+        self.value = value
+        return self
+
+    def _new_from_result(self: BitSelf, value: T) -> BitSelf:
+        """
+        Creates a new object of this object's class holding `value`,
+            the (Pythonic) result of an operation on this object's value.
+
+        Subclasses with per-instance representation state (e.g. `SInt.int_format`)
+            override this to carry that state over to the result.
+
+        Args:
+            value (T): The value of the result, already a `py_type`.
+
+        Returns:
+            BitSelf: The new BitType object.
+        """
+        return type(self)._new_from_value(value)
+
+    @classmethod
+    def from_bytes(
+        cls: Type[BitSelf],
+        the_bytes: bytes,
+        endianness: Literal["big", "little"] = "big",
+    ) -> BitSelf:
+        """
+        Creates a new BitType object from a bytes object.
+
+        Args:
+            the_bytes (bytes): The bytes holding the object's bits.
+            endianness (Literal["big", "little"]): The endianness of the object.
+
+        Returns:
+            BitSelf: The new BitType object.
+        """
+        return cls(bits=BitVector(the_bytes), endianness=endianness)
+
+    @classmethod
+    def from_bytes_batch(
+        cls: Type[BitSelf],
+        the_bytes: bytes,
+        endianness: Literal["big", "little"] = "big",
+    ) -> List[BitSelf]:
+        """
+        Creates a list of BitType objects from a bytes object holding
+            back-to-back `num_bits`-sized units.
+
+        The bytes are converted to a BitVector once and then sliced per unit,
+            rather than converting each unit's bytes separately.
+        Fewer than 8 trailing bits that don't fill a unit are treated as padding.
+
+        Args:
+            the_bytes (bytes): The bytes holding the objects' bits.
+            endianness (Literal["big", "little"]): The endianness of the objects.
+
+        Returns:
+            List[BitSelf]: The new BitType objects, in order.
+        """
+        num_bits = cls.num_bits
+        count, num_padding_bits = divmod(len(the_bytes) * 8, num_bits)
+        if num_padding_bits >= 8:
+            raise ValueError(
+                f"Expected a multiple of {num_bits} bits, got {len(the_bytes) * 8}"
+            )
+        all_bits = BitVector(buffer=the_bytes)
+        new_from_bits = cls._new_from_bits
+        return [
+            new_from_bits(all_bits[start : start + num_bits], endianness)
+            for start in range(0, count * num_bits, num_bits)
+        ]
+
     def _binary_value_op(
         self: BitSelf, other: Any, operation: Callable[[BitSelf, Any], BitSelf]
     ):
@@ -317,9 +558,10 @@ class BitType(ABC, Generic[T]):
             try:
                 product = operation(self.value, other_value)
 
-                if not isinstance(product, type(self).py_type):
+                cls = type(self)
+                if not isinstance(product, cls.py_type):
                     return NotImplemented
-                return type(self)(product)
+                return self._new_from_result(cls.py_type(product))
             except TypeError:
                 return NotImplemented
 
@@ -357,7 +599,7 @@ class BitType(ABC, Generic[T]):
 
         def attempt_operation(other_bits: Any):
             try:
-                product = operation(self.bits, other_bits)
+                product = operation(self._bits, other_bits)
 
                 try:
                     return type(self)(product)
@@ -367,7 +609,7 @@ class BitType(ABC, Generic[T]):
                 return NotImplemented
 
         if isinstance(other, BitType):
-            return attempt_operation(other.bits)
+            return attempt_operation(other._bits)
 
         try:
             return attempt_operation(other)
@@ -404,7 +646,14 @@ class BitType(ABC, Generic[T]):
         return self._binary_bits_op(other, lambda x, y: y ^ x)
 
     def __invert__(self: BitSelf) -> BitSelf:
-        return type(self)(bits=~self.bits)
+        return type(self)(bits=~self._bits)
+
+
+class _SpecializedStructValue(property):
+    """
+    A `StructPackedBitType.value` property generated for a single subclass,
+        with that subclass's Structs and padding bound in.
+    """
 
 
 class StructPackedBitType(BitType[T]):
@@ -427,9 +676,100 @@ class StructPackedBitType(BitType[T]):
             based on the endianness
     """
 
+    __slots__ = ()
+
     packing_format_letter: Final[str]
     """The packing format letter for struct to use for converting to/from bytes."""
 
+    _structs: Dict[str, struct.Struct]
+    """The precompiled Struct for each endianness, keyed by endianness."""
+
+    _pad: Optional[BitVector] = None
+    """The zero bits prepended to fill out a whole byte, or None if none are needed."""
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precompiles the big- and little-endian Structs for the subclass's
+            packing format letter, and the zero padding for sub-byte sizes,
+            so they are not rebuilt on every value access.
+        """
+        super().__init_subclass__(**kwargs)
+        num_bits = cls._calculate_num_bits()
+        if num_bits is not None:
+            pad_len = -num_bits % 8
+            cls._pad = BitVector(pad_len) if pad_len else None
+        packing_format_letter = getattr(cls, "packing_format_letter", None)
+        if packing_format_letter is not None:
+            cls._structs = {
+                "big": struct.Struct(f">{packing_format_letter}"),
+                "little": struct.Struct(f"<{packing_format_letter}"),
+            }
+            if cls._uses_generic_struct_value():
+                cls.value = cls._specialized_value()
+
+    @classmethod
+    def _uses_generic_struct_value(cls) -> bool:
+        """
+        Whether the class resolves `value` to StructPackedBitType's own property
+            (or a specialization of it).
+        """
+        value = getattr_static(cls, "value")
+        return value is StructPackedBitType.__dict__["value"] or isinstance(
+            value, _SpecializedStructValue
+        )
+
+    @classmethod
+    def _specialized_value(cls) -> _SpecializedStructValue:
+        """
+        Builds a `value` property for the class with its Structs and padding bound
+            as closure constants, skipping the generic getter/setter's
+            per-access lookups.
+
+        If the class overrides `skip_struct_packing` (e.g. `SInt8`), the property
+            checks it and falls back to the next `value` on the MRO,
+            as the generic property does; otherwise the check is skipped.
+
+        Returns:
+            _SpecializedStructValue: The specialized `value` property.
+        """
+        big_struct, little_struct = cls._structs["big"], cls._structs["little"]
+        pad = cls._pad
+        pad_len = 0 if pad is None else len(pad)
+        skip_struct_packing = getattr_static(cls, "skip_struct_packing")
+        if skip_struct_packing is StructPackedBitType.__dict__["skip_struct_packing"]:
+            skip = None
+        else:
+            skip = skip_struct_packing.fget
+            fallback = super(StructPackedBitType, cls).value
+            fallback_get, fallback_set = fallback.fget, fallback.fset
+
+        def value_getter(self):
+            if skip is not None and skip(self):
+                return fallback_get(self)
+            the_bits = self._bits if pad is None else pad + self._bits
+            endianness = self._endianness
+            if endianness == "big":
+                return big_struct.unpack(the_bits)[0]
+            elif endianness == "little":
+                return little_struct.unpack(the_bits)[0]
+            return self._struct.unpack(the_bits)[0]
+
+        def value_setter(self, value):
+            if skip is not None and skip(self):
+                fallback_set(self, value)
+                return
+            endianness = self._endianness
+            if endianness == "big":
+                packed = big_struct.pack(value)
+            elif endianness == "little":
+                packed = little_struct.pack(value)
+            else:
+                packed = self._struct.pack(value)
+            the_bits = _new_bitarray(BitVector, buffer=packed)
+            self._bits = the_bits if pad is None else the_bits[pad_len:]
+
+        return _SpecializedStructValue(value_getter, value_setter)
+
     @property
     def skip_struct_packing(self) -> bool:
         """
@@ -451,32 +791,68 @@ class StructPackedBitType(BitType[T]):
         Returns:
             str: the struct packing format for the subclass.
         """
-        cls = self.__class__
-        if self.endianness == "little":
-            return f"<{cls.packing_format_letter}"
-        elif self.endianness == "big":
-            return f">{cls.packing_format_letter}"
-        else:
+        return self._struct.format
+
+    @property
+    def _struct(self) -> struct.Struct:
+        """
+        The precompiled Struct matching the object's endianness.
+
+        Returns:
+            struct.Struct: The Struct used to pack/unpack the object's value.
+        """
+        try:
+            return self._structs[self._endianness]
+        except KeyError:
             raise ValueError(
-                f"Endianness must be either 'little' or 'big', not {self.endianness}"
+                f"Endianness must be either 'little' or 'big', not {self._endianness}"
             )
 
+    @classmethod
+    def from_bytes(
+        cls: Type[BitSelf],
+        the_bytes: bytes,
+        endianness: Literal["big", "little"] = "big",
+    ) -> BitSelf:
+        """
+        Creates a new StructPackedBitType object from a bytes object.
+
+        The bytes are wrapped directly, skipping `__init__`'s source dispatch
+            and the `bits` setter.
+
+        Args:
+            the_bytes (bytes): The bytes holding the object's bits.
+            endianness (Literal["big", "little"]): The endianness of the object.
+
+        Returns:
+            BitSelf: The new StructPackedBitType object.
+        """
+        if len(the_bytes) * 8 != cls.num_bits:
+            raise ValueError(f"Expected {cls.num_bits} bits, got {len(the_bytes) * 8}")
+        return cls._new_from_bits(BitVector(buffer=the_bytes), endianness)
+
     @property
     def value(self) -> T:
         if not self.skip_struct_packing:
-            the_bits = self.bits
-            if not len(the_bits) % 8 == 0:
-                the_bits = BitVector(8 - len(the_bits) % 8) + the_bits
-            return struct.unpack(self.packing_format, bytes(self.bits))[0]
+            the_bits = self._bits
+            if self._pad is not None:
+                the_bits = self._pad + the_bits
+            # Unpacks straight from the bits' buffer, without an intermediate bytes copy
+            return self._struct.unpack(the_bits)[0]
         else:
             return super().value
 
     @value.setter
     def value(self, value: T):
         if not self.skip_struct_packing:
-            self._bits = BitVector(struct.pack(self.packing_format, value))
+            # Wraps the packed bytes directly, skipping BitVector's source dispatch
+            the_bits = _new_bitarray(BitVector, buffer=self._struct.pack(value))
+            if self._pad is not None:
+                the_bits = the_bits[len(self._pad) :]
+            self._bits = the_bits
         else:
-            super().value = value
+            # super() proxies don't support assignment, so call the setter directly
+            super(StructPackedBitType, type(self)).value.__set__(self, value)
 
 
 def bytes_to_bittype(unitbytes: bytes, unittype: type[BitType]) -> BitType:
@@ -490,4 +866,29 @@ def bytes_to_bittype(unitbytes: bytes, unittype: type[BitType]) -> BitType:
     Returns:
         BitType: The BitType object created from the bytes object.
     """
-    return unittype(bits=BitVector(unitbytes))
+    return unittype.from_bytes(unitbytes)
+
+
+def bittypes_to_bytes(bittypes: Iterable[BitType]) -> bytes:
+    """
+    Concatenates the bytes representations of the provided BitType objects.
+    Equivalent to `b"".join(bytes(bittype) for bittype in bittypes)`.
+
+    When every object is little-endian, the big-endian bytes are joined in
+        reverse order and the result is reversed once, which flips each object's
+        bytes in place without reversing them object-by-object.
+
+    Args:
+        bittypes (Iterable[BitType]): The BitType objects to convert.
+
+    Returns:
+        bytes: The concatenated bytes of the BitType objects.
+    """
+    bittypes = list(bittypes)
+    endiannesses = {bittype._endianness for bittype in bittypes}
+    if endiannesses == {"little"}:
+        reversed_big_bytes = [bittype._bits.tobytes() for bittype in reversed(bittypes)]
+        return b"".join(reversed_big_bytes)[::-1]
+    elif endiannesses <= {"big"}:
+        return b"".join([bittype._bits.tobytes() for bittype in bittypes])
+    return b"".join([bytes(bittype) for bittype in bittypes])
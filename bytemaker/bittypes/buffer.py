@@ -44,20 +44,43 @@ class Buffer(BitType[BitVector]):
         or use one of the pre-defined subclasses.
     """
 
+    __slots__ = ()
+
     py_type = BitVector
 
     @property
     def value(self):
-        return self.bits
+        return self._bits
 
     @value.setter
     def value(self, value):
         self._bits = BitVector(value)
 
+    def __hash__(self):
+        # BitVectors are unhashable, so the hash is based on the bits' bytes instead
+        return hash(self._bits.tobytes())
+
+    @classmethod
+    def from_bits(cls: Type[BufferSelf], bits: BitVector) -> BufferSelf:
+        """DEPRECATED
+        Use the constructor with a BitVector-like object instead.
+
+        Creates a new Buffer object from a sequence of bits.
+        Since a Buffer's value is its bits, this skips the constructor's
+            value conversion and only checks the number of bits.
+
+        Args:
+            bits (BitVector): The sequence of bits to create the Buffer from.
+        """
+        if len(bits) != cls.num_bits:
+            raise ValueError(f"Expected {cls.num_bits} bits, got {len(bits)}")
+        return cls._new_from_bits(bits)
+
     @classmethod
     def specialize(cls: Type[BufferSelf], num_bits_: int, name_: Optional[str] = None):
         """
         Returns a subclass of Buffer with the specified number of bits.
+        Repeated calls with the same arguments return the same subclass.
 
         Args:
             num_bits_ (int): The number of bits the buffer should have.
@@ -67,234 +90,57 @@ class Buffer(BitType[BitVector]):
         Returns:
             Type[BufferSelf]: A subclass of Buffer with the specified number of bits.
         """
+        key = (num_bits_, name_)
+        if key in cls._specializations:
+            return cls._specializations[key]
 
         class _Buffer(cls):
+            __slots__ = ()
             _num_bits = num_bits_
 
         if name_:
             _Buffer.__name__ = name_
+            _Buffer.__qualname__ = name_
 
+        cls._specializations[key] = _Buffer
         return _Buffer
 
+    def __class_getitem__(cls, num_bits_: int):
+        """
+        Returns the subclass of Buffer with the specified number of bits,
+            e.g. `Buffer[8]` is `Buffer8`.
 
-Buffer.base_bit_type = Buffer
-
-
-class Buffer1(Buffer):
-    _num_bits = 1
-
-
-class Buffer2(Buffer):
-    _num_bits = 2
-
-
-class Buffer3(Buffer):
-    _num_bits = 3
-
-
-class Buffer4(Buffer):
-    _num_bits = 4
-
-
-class Buffer5(Buffer):
-    _num_bits = 5
-
-
-class Buffer6(Buffer):
-    _num_bits = 6
-
-
-class Buffer7(Buffer):
-    _num_bits = 7
-
-
-class Buffer8(Buffer):
-    _num_bits = 8
-
-
-class Buffer9(Buffer):
-    _num_bits = 9
-
-
-class Buffer10(Buffer):
-    _num_bits = 10
-
-
-class Buffer11(Buffer):
-    _num_bits = 11
-
-
-class Buffer12(Buffer):
-    _num_bits = 12
-
-
-class Buffer13(Buffer):
-    _num_bits = 13
-
-
-class Buffer14(Buffer):
-    _num_bits = 14
-
-
-class Buffer15(Buffer):
-    _num_bits = 15
-
-
-class Buffer16(Buffer):
-    _num_bits = 16
-
-
-class Buffer17(Buffer):
-    _num_bits = 17
-
-
-class Buffer18(Buffer):
-    _num_bits = 18
-
-
-class Buffer19(Buffer):
-    _num_bits = 19
-
-
-class Buffer20(Buffer):
-    _num_bits = 20
-
-
-class Buffer21(Buffer):
-    _num_bits = 21
-
-
-class Buffer22(Buffer):
-    _num_bits = 22
-
-
-class Buffer23(Buffer):
-    _num_bits = 23
-
-
-class Buffer24(Buffer):
-    _num_bits = 24
-
-
-class Buffer25(Buffer):
-    _num_bits = 25
-
-
-class Buffer26(Buffer):
-    _num_bits = 26
-
-
-class Buffer27(Buffer):
-    _num_bits = 27
-
-
-class Buffer28(Buffer):
-    _num_bits = 28
-
-
-class Buffer29(Buffer):
-    _num_bits = 29
-
-
-class Buffer30(Buffer):
-    _num_bits = 30
-
-
-class Buffer31(Buffer):
-    _num_bits = 31
-
-
-class Buffer32(Buffer):
-    _num_bits = 32
-
-
-class Buffer50(Buffer):
-    _num_bits = 50
-
-
-class Buffer64(Buffer):
-    _num_bits = 64
-
-
-class Buffer100(Buffer):
-    _num_bits = 100
-
-
-class Buffer128(Buffer):
-    _num_bits = 128
-
-
-class Buffer200(Buffer):
-    _num_bits = 200
-
-
-class Buffer250(Buffer):
-    _num_bits = 250
-
-
-class Buffer256(Buffer):
-    _num_bits = 256
-
-
-class Buffer500(Buffer):
-    _num_bits = 500
-
-
-class Buffer512(Buffer):
-    _num_bits = 512
-
+        Args:
+            num_bits_ (int): The number of bits the buffer should have.
 
-class Buffer1000(Buffer):
-    _num_bits = 1000
+        Returns:
+            Type[Buffer]: A subclass of Buffer with the specified number of bits.
+        """
+        return cls.specialize(num_bits_, f"{cls.__name__}{num_bits_}")
 
 
-class Buffer1024(Buffer):
-    _num_bits = 1024
+Buffer.base_bit_type = Buffer
 
 
-__all__ = [
-    "Buffer",
-    "Buffer1",
-    "Buffer2",
-    "Buffer3",
-    "Buffer4",
-    "Buffer5",
-    "Buffer6",
-    "Buffer7",
-    "Buffer8",
-    "Buffer9",
-    "Buffer10",
-    "Buffer11",
-    "Buffer12",
-    "Buffer13",
-    "Buffer14",
-    "Buffer15",
-    "Buffer16",
-    "Buffer17",
-    "Buffer18",
-    "Buffer19",
-    "Buffer20",
-    "Buffer21",
-    "Buffer22",
-    "Buffer23",
-    "Buffer24",
-    "Buffer25",
-    "Buffer26",
-    "Buffer27",
-    "Buffer28",
-    "Buffer29",
-    "Buffer30",
-    "Buffer31",
-    "Buffer32",
-    "Buffer50",
-    "Buffer64",
-    "Buffer100",
-    "Buffer128",
-    "Buffer200",
-    "Buffer250",
-    "Buffer256",
-    "Buffer500",
-    "Buffer512",
-    "Buffer1000",
-    "Buffer1024",
-]
+_PREDEFINED_NUM_BITS = (
+    *range(1, 33),
+    50,
+    64,
+    100,
+    128,
+    200,
+    250,
+    256,
+    500,
+    512,
+    1000,
+    1024,
+)
+
+# The pre-defined subclasses (Buffer1, Buffer2, ...) are memoized specializations
+for _num_bits in _PREDEFINED_NUM_BITS:
+    globals()[f"Buffer{_num_bits}"] = Buffer.specialize(_num_bits, f"Buffer{_num_bits}")
+del _num_bits
+
+
+__all__ = ["Buffer"] + [f"Buffer{num_bits}" for num_bits in _PREDEFINED_NUM_BITS]
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import math
 import operator
+import struct
+from functools import lru_cache
+from inspect import getattr_static
 from typing import TYPE_CHECKING
 
 from bytemaker.bittypes.bittype import BitType, StructPackedBitType
 from bytemaker.bitvector import BitVector
-from bytemaker.typing_redirect import Any, Final, Optional, Tuple, TypeVar
-from bytemaker.utils import classproperty
+from bytemaker.typing_redirect import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
     FloatSelf = TypeVar("FloatSelf", bound="Float")
@@ -17,6 +31,35 @@ else:
         FloatSelf = TypeVar("FloatSelf", bound="Float")
 
 
+@lru_cache(maxsize=None)
+def _special_bit_patterns(
+    num_exponent_bits: int, num_mantissa_bits: int
+) -> Tuple[Dict[float, int], int]:
+    """
+    Returns the bit patterns of the infinities (keyed by value)
+        and of the quiet NaN, for the given numbers of exponent and mantissa bits.
+    """
+    inf_pattern = ((1 << num_exponent_bits) - 1) << num_mantissa_bits
+    ninf_pattern = (1 << (num_exponent_bits + num_mantissa_bits)) | inf_pattern
+    nan_pattern = inf_pattern | (1 << (num_mantissa_bits - 1))
+    return {math.inf: inf_pattern, -math.inf: ninf_pattern}, nan_pattern
+
+
+_IEEE_FLOAT_STRUCTS: Dict[Tuple[int, int], struct.Struct] = {
+    (5, 10): struct.Struct(">e"),
+    (8, 23): struct.Struct(">f"),
+    (11, 52): struct.Struct(">d"),
+}
+"""The big-endian IEEE 754 structs, keyed by (exponent bits, mantissa bits)."""
+
+
+class _SpecializedFloatValue(property):
+    """
+    A `Float.value` property generated for a single subclass,
+        with that subclass's field widths, masks and exponent bias bound in.
+    """
+
+
 class Float(BitType[float]):
     """
     A BitType that represents an integer.
@@ -30,6 +73,9 @@ class Float(BitType[float]):
     - The next `num_exponent_bits` bits are the exponent
     - The next `num_mantissa_bits` bits are the mantissa
 
+    Values may be set from `int`s (including `bool`s) as well as `float`s;
+        they are converted with `float()` before being encoded.
+
     Class Attributes:
     -----------------
     num_bits : int
@@ -51,16 +97,115 @@ class Float(BitType[float]):
        The `float` value of this `Float` object.
     """
 
+    __slots__ = ()
+
     py_type = float
     num_exponent_bits: Final[int]
     """The number of bits used to store the exponent."""
     num_mantissa_bits: Final[int]
     """The number of bits used to store the mantissa."""
 
-    @classproperty
+    _exponent_bias: int
+    _exponent_mask: int
+    _mantissa_mask: int
+    _mantissa_scale: int
+    _decode_binstring_int: Callable[[int], float]
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precomputes the exponent bias and the field masks once per Float subclass,
+            so that `value` doesn't need to recompute them on every access.
+        """
+        super().__init_subclass__(**kwargs)
+        num_exponent_bits = getattr(cls, "num_exponent_bits", None)
+        num_mantissa_bits = getattr(cls, "num_mantissa_bits", None)
+        if num_exponent_bits is not None and num_mantissa_bits is not None:
+            cls._exponent_bias = (1 << (num_exponent_bits - 1)) - 1
+            cls._exponent_mask = (1 << num_exponent_bits) - 1
+            cls._mantissa_scale = 1 << num_mantissa_bits
+            cls._mantissa_mask = cls._mantissa_scale - 1
+            cls._decode_binstring_int = staticmethod(cls._binstring_int_decoder())
+            if cls._uses_generic_float_value():
+                cls.value = cls._specialized_value()
+
+    @classmethod
+    def _uses_generic_float_value(cls) -> bool:
+        """
+        Whether the class resolves `value` to Float's own property
+            (or a specialization of it), rather than to e.g. a struct-packed one.
+        """
+        value = getattr_static(cls, "value")
+        return value is Float.__dict__["value"] or isinstance(
+            value, _SpecializedFloatValue
+        )
+
+    @classmethod
+    def _specialized_value(cls) -> _SpecializedFloatValue:
+        """
+        Builds a `value` property for the class whose getter has the padding
+            and the class's decoder bound as closure constants,
+            instead of looking them up on every access.
+
+        Classes with the field widths of an IEEE 754 half, single or double
+            are (un)packed with `struct` instead, which also covers their
+            subnormals, infinities and NaNs.
+
+        Returns:
+            _SpecializedFloatValue: The specialized `value` property.
+        """
+        ieee_struct = _IEEE_FLOAT_STRUCTS.get(
+            (cls.num_exponent_bits, cls.num_mantissa_bits)
+        )
+        if ieee_struct is not None:
+            return cls._specialized_ieee_value(ieee_struct)
+
+        pad_len = -cls.num_bits % 8
+        decode_binstring_int = cls._decode_binstring_int
+
+        def value_getter(self) -> float:
+            # tobytes() zero-fills the last byte, so shift those bits back out
+            return decode_binstring_int(
+                int.from_bytes(self._bits.tobytes(), "big") >> pad_len
+            )
+
+        return _SpecializedFloatValue(value_getter, Float.__dict__["value"].fset)
+
+    @staticmethod
+    def _specialized_ieee_value(ieee_struct: struct.Struct) -> _SpecializedFloatValue:
+        """
+        Builds a `value` property that (un)packs the bits with `ieee_struct`.
+        Values too large for the format are set as the infinity of their sign.
+
+        Args:
+            ieee_struct (struct.Struct): The big-endian struct for the format.
+
+        Returns:
+            _SpecializedFloatValue: The specialized `value` property.
+        """
+        pack = ieee_struct.pack
+        unpack = ieee_struct.unpack
+
+        def value_getter(self) -> float:
+            return unpack(self._bits.tobytes())[0]
+
+        def value_setter(self, value):
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"Expected a float or an int, got {type(value)}")
+            try:
+                packed = pack(value)
+            except OverflowError:
+                packed = pack(math.copysign(math.inf, value))
+            self.bits = BitVector(buffer=packed)
+
+        return _SpecializedFloatValue(value_getter, value_setter)
+
     @classmethod
-    def num_bits(cls) -> int:
-        return 1 + cls.num_exponent_bits + cls.num_mantissa_bits
+    def _calculate_num_bits(cls) -> Optional[int]:
+        num_exponent_bits = getattr(cls, "num_exponent_bits", None)
+        num_mantissa_bits = getattr(cls, "num_mantissa_bits", None)
+        if num_exponent_bits is None or num_mantissa_bits is None:
+            return None
+        return 1 + num_exponent_bits + num_mantissa_bits
 
     def __float__(self):
         """
@@ -78,44 +223,21 @@ class Float(BitType[float]):
 
     @property
     def value(self) -> float:
-        # the first bit is the sign bit
-        # "0" means positive, "1" means negative
-        sign: int = -1 if self.bits[0] else 1
-        # The exponent is not stored as a two's-
-        # complement signed integer, but is still
-        # signed. This is achieved by biasing the
-        # stored unsigned binary integer with
-        # an eventual offset. The biased exponent
-        # is then just the unsigned int
-        exponent: int = sum(
-            2 ** (self.num_exponent_bits - i - 1) * self.bits[1 + i]
-            for i in range(self.num_exponent_bits)
-        )
-
-        # The bias is 2^(num_exponent_bits_ - 1) - 1
-        # To ensure that about half of the values
-        # are negative and half are positive
-        unbiased_exponent: int = exponent - (2 ** (self.num_exponent_bits - 1) - 1)
-
-        mantissa: int = sum(
-            (self.bits[1 + self.num_exponent_bits + i] * 2 ** -(i + 1))
-            for i in range(self.num_mantissa_bits)
-        )
-
-        magnitude: float = 2**unbiased_exponent * (1 + mantissa)
-
-        result = sign * magnitude
-
-        return result
+        # Read all the bits as one unsigned int, then decode its fields
+        # tobytes() zero-fills the last byte, so shift those bits back out
+        bits_int = int.from_bytes(self._bits.tobytes(), "big") >> (-self.num_bits % 8)
+        return self._decode_binstring_int(bits_int)
 
     @value.setter
     def value(self, value):
-        if not isinstance(value, float):
-            raise ValueError(f"Expected a float, got {type(value)}")
-        self.bits = BitVector(
-            self.__class__.to_binstring(
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Expected a float or an int, got {type(value)}")
+        value = float(value)
+        self.bits = BitVector.from_uint(
+            Float._float_to_binstring_int(
                 value, self.num_exponent_bits, self.num_mantissa_bits
-            )
+            ),
+            self.num_bits,
         )
 
     def to_binstring(
@@ -131,82 +253,200 @@ class Float(BitType[float]):
         Returns:
             str: The unprefixed binary string representation of the `float`.
         """
-        if isinstance(self, Float):
-            num = self.value
-        else:
-            num = self
-
-        if num == 0:
-            return "0" + "0" * (num_exponent_bits + num_mantissa_bits)
-        if num == float("inf"):
-            return "0" + "1" * (num_exponent_bits) + "0" * num_mantissa_bits
-        if num == -float("inf"):
-            return "1" + "1" * (num_exponent_bits) + "0" * num_mantissa_bits
-        if num == float("NaN"):
-            return "0" + "1" * (num_exponent_bits + 1) + "0" * (num_mantissa_bits - 1)
-
-        def get_sign_bit(value) -> int:
-            return 0 if value >= 0 else 1
-
-        def int_to_bin(integer) -> str:
-            return bin(integer)[2:]
-
-        def frac_to_bin(fraction, bits) -> str:
-            result = []
-            while fraction and len(result) < bits:
-                fraction *= 2
-                bit = int(fraction)
-                result.append(bit)
-                fraction -= bit
-            return "".join(map(str, result))
-
-        def normalize(binary_int: str, binary_frac: str) -> Tuple[str, int]:
-            combined = binary_int + binary_frac
-            first_one = combined.index("1")
-            normalized = "1." + combined[first_one + 1 :]
-            exponent = len(binary_int) - first_one - 1
-            return normalized, exponent
-
-        def get_exponent_bias(num_exponent_bits: int) -> int:
-            return (2 ** (num_exponent_bits - 1)) - 1
-
-        def int_to_binary(integer: int, bits: int) -> str:
-            binary = bin(integer).replace("0b", "")
-            return binary.zfill(bits)
-
-        def assemble_bits(
-            sign, biased_exponent, mantissa, num_exponent_bits, num_mantissa_bits
-        ) -> str:
-            return (
-                f"{sign}"
-                f"{int_to_binary(biased_exponent, num_exponent_bits)}"
-                f"{mantissa[:num_mantissa_bits].ljust(num_mantissa_bits, '0')}"
-            )
+        num = self.value if isinstance(self, Float) else self
+        return format(
+            Float._float_to_binstring_int(num, num_exponent_bits, num_mantissa_bits),
+            f"0{1 + num_exponent_bits + num_mantissa_bits}b",
+        )
+
+    def to_binstring_int(
+        self: Float | float, num_exponent_bits=8, num_mantissa_bits=23
+    ) -> int:
+        """
+        Convert a `float` (or a `Float`) to the unsigned integer whose binary
+            representation is `to_binstring`'s result.
+
+        Args:
+            num_exponent_bits (int): The number of bits to use for the exponent.
+            num_mantissa_bits (int): The number of bits to use for the mantissa.
 
-        sign_bit = get_sign_bit(num)
-        abs_num = abs(num)
+        Returns:
+            int: The sign, exponent and mantissa bits of the `float`, as one int.
+        """
+        num = self.value if isinstance(self, Float) else self
+        return Float._float_to_binstring_int(num, num_exponent_bits, num_mantissa_bits)
 
-        integral_part = int(abs_num)
-        fractional_part = abs_num - integral_part
+    @staticmethod
+    def _float_to_binstring_int(
+        num: float, num_exponent_bits: int, num_mantissa_bits: int
+    ) -> int:
+        """
+        `to_binstring_int` for a (Pythonic) `float`, without the `Float` dispatch.
 
-        integral_bin = int_to_bin(integral_part)
-        fractional_bin = frac_to_bin(fractional_part, num_mantissa_bits + 1)
+        Args:
+            num (float): The value to convert.
+            num_exponent_bits (int): The number of bits to use for the exponent.
+            num_mantissa_bits (int): The number of bits to use for the mantissa.
 
-        normalized, exponent = normalize(integral_bin, fractional_bin)
+        Returns:
+            int: The sign, exponent and mantissa bits of `num`, as one int.
+        """
+        special_bit_patterns, nan_bit_pattern = _special_bit_patterns(
+            num_exponent_bits, num_mantissa_bits
+        )
+        if num != num:
+            return nan_bit_pattern
+        special_bit_pattern = special_bit_patterns.get(num)
+        if special_bit_pattern is not None:
+            return special_bit_pattern
+
+        # copysign also gives -0.0 its sign bit
+        sign_bit = 0 if math.copysign(1.0, num) > 0 else 1
+        exponent_bias = (1 << (num_exponent_bits - 1)) - 1
+        # abs(num) == frexp_mantissa * 2**frexp_exponent, frexp_mantissa in [0.5, 1)
+        frexp_mantissa, frexp_exponent = math.frexp(abs(num))
+        exponent = frexp_exponent - 1
+        if not num or exponent + exponent_bias <= 0:
+            # Zero or below the smallest normal number: a subnormal, with the mantissa
+            #   counting units of 2**(1 - bias - num_mantissa_bits).
+            #   Rounding up to 1 << num_mantissa_bits gives the smallest normal,
+            #   and rounding down to 0 gives (signed) zero.
+            mantissa_int = round(
+                math.ldexp(abs(num), exponent_bias - 1 + num_mantissa_bits)
+            )
+            return (sign_bit << (num_exponent_bits + num_mantissa_bits)) | mantissa_int
+        # The 52 bits after the leading one, which is exact for any Python float
+        trailing_int = int(math.ldexp(frexp_mantissa, 53)) & ((1 << 52) - 1)
+        if num_mantissa_bits >= 52:
+            mantissa_int = trailing_int << (num_mantissa_bits - 52)
+        else:
+            num_dropped_bits = 52 - num_mantissa_bits
+            mantissa_int = trailing_int >> num_dropped_bits
+            remainder = trailing_int & ((1 << num_dropped_bits) - 1)
+            halfway = 1 << (num_dropped_bits - 1)
+            # Round to nearest, ties to even
+            if remainder > halfway or (remainder == halfway and mantissa_int & 1):
+                mantissa_int += 1
+                if mantissa_int >> num_mantissa_bits:
+                    # The mantissa rounded up to 2.0, so carry into the exponent
+                    mantissa_int = 0
+                    exponent += 1
 
-        exponent_bias = get_exponent_bias(num_exponent_bits)
         biased_exponent = exponent + exponent_bias
+        if biased_exponent >= (1 << num_exponent_bits) - 1:
+            # Beyond the largest finite number, so round to infinity
+            return special_bit_patterns[math.copysign(math.inf, num)]
+
+        return (
+            (sign_bit << (num_exponent_bits + num_mantissa_bits))
+            | (biased_exponent << num_mantissa_bits)
+            | mantissa_int
+        )
+
+    @classmethod
+    def _binstring_int_decoder(cls) -> Callable[[int], float]:
+        """
+        Builds the inverse of `_float_to_binstring_int` for the class's widths:
+            a function decoding the sign, exponent and mantissa bits of a float,
+            as one int, into a (Pythonic) `float`.
+        The class's precomputed masks and exponent bias are bound in as
+            closure constants.
+
+        Returns:
+            Callable[[int], float]: The decoding function.
+        """
+        num_mantissa_bits = cls.num_mantissa_bits
+        sign_shift = cls.num_exponent_bits + num_mantissa_bits
+        exponent_mask = cls._exponent_mask
+        mantissa_mask = cls._mantissa_mask
+        mantissa_scale = cls._mantissa_scale
+        # The exponent is stored biased by 2^(num_exponent_bits - 1) - 1,
+        #   so that about half of the exponents are negative.
+        # The mantissa is scaled into an int, hence the extra offset.
+        normal_exponent_offset = cls._exponent_bias + num_mantissa_bits
+        # Zero and the subnormals share the smallest normal exponent
+        subnormal_exponent = 1 - normal_exponent_offset
+
+        def decode_binstring_int(bits_int: int) -> float:
+            exponent = (bits_int >> num_mantissa_bits) & exponent_mask
+            mantissa_int = bits_int & mantissa_mask
+            if exponent == exponent_mask:
+                # An all-ones exponent marks the infinities and the NaNs
+                magnitude = math.nan if mantissa_int else math.inf
+            elif exponent:
+                # Normal numbers have an implicit leading one before the mantissa
+                magnitude = math.ldexp(
+                    mantissa_int | mantissa_scale, exponent - normal_exponent_offset
+                )
+            else:
+                # Zero and the subnormals have no leading one
+                magnitude = math.ldexp(mantissa_int, subnormal_exponent)
+            # The first bit is the sign bit, "1" meaning negative
+            return -magnitude if bits_int >> sign_shift else magnitude
+
+        return decode_binstring_int
+
+    @classmethod
+    def from_bytes_array(
+        cls, the_bytes: bytes, endianness: Literal["big", "little"] = "big"
+    ) -> List[float]:
+        """
+        Decodes a bytes object holding back-to-back `num_bits`-sized floats
+            of this class into a list of (Pythonic) `float`s.
 
-        mantissa_bits = normalized.split(".")[1]
+        Equivalent to `[x.value for x in cls.from_bytes_batch(the_bytes, endianness)]`,
+            but struct-packed classes unpack every value in a single `struct` call.
+
+        Args:
+            the_bytes (bytes): The bytes holding the floats.
+            endianness (Literal["big", "little"]): The endianness of the floats.
 
-        final_binary = assemble_bits(
-            sign_bit,
-            biased_exponent,
-            mantissa_bits,
-            num_exponent_bits,
-            num_mantissa_bits,
+        Returns:
+            List[float]: The decoded values, in order.
+        """
+        packing_format_letter = getattr(cls, "packing_format_letter", None)
+        if packing_format_letter is None:
+            return [
+                bittype.value for bittype in cls.from_bytes_batch(the_bytes, endianness)
+            ]
+        num_bytes = cls.num_bits // 8
+        if len(the_bytes) % num_bytes != 0:
+            raise ValueError(
+                f"Expected a multiple of {cls.num_bits} bits, got {len(the_bytes) * 8}"
+            )
+        byte_order = ">" if endianness == "big" else "<"
+        count = len(the_bytes) // num_bytes
+        return list(
+            struct.unpack(f"{byte_order}{count}{packing_format_letter}", the_bytes)
         )
-        return final_binary
+
+    @classmethod
+    def to_bytes_array(
+        cls, values: Iterable[float], endianness: Literal["big", "little"] = "big"
+    ) -> bytes:
+        """
+        Encodes (Pythonic) `float`s as back-to-back `num_bits`-sized floats
+            of this class. The inverse of `from_bytes_array`.
+
+        Struct-packed classes pack every value in a single `struct` call.
+
+        Args:
+            values (Iterable[float]): The values to encode.
+            endianness (Literal["big", "little"]): The endianness of the floats.
+
+        Returns:
+            bytes: The encoded floats, zero-padded to a whole number of bytes.
+        """
+        values = list(values)
+        packing_format_letter = getattr(cls, "packing_format_letter", None)
+        if packing_format_letter is None:
+            return BitVector(
+                "".join(
+                    cls(value, endianness=endianness)._bits.to01() for value in values
+                )
+            ).tobytes()
+        byte_order = ">" if endianness == "big" else "<"
+        return struct.pack(f"{byte_order}{len(values)}{packing_format_letter}", *values)
 
     @classmethod
     def specialize(
@@ -219,6 +459,7 @@ class Float(BitType[float]):
         """
         Produce a subclass of Float with the specified number of bits
             in the exponent and mantissa.
+        Repeated calls with the same arguments return the same subclass.
 
         If `packing_format_letter` is provided, the subclass will also be a
             `StructPackedBitType` and use `struct`'s packing/unpacking functions
@@ -238,9 +479,14 @@ class Float(BitType[float]):
         Returns:
             type[Float]: The subclass of `Float` with the specified number of bits.
         """
+        key = (num_exponent_bits_, num_mantissa_bits_, packing_format_letter_, name_)
+        if key in cls._specializations:
+            return cls._specializations[key]
+
         if packing_format_letter_ is not None:
 
-            class _Float(cls, StructPackedBitType[float]):
+            class _Float(StructPackedBitType[float], cls):
+                __slots__ = ()
                 num_exponent_bits = num_exponent_bits_
                 num_mantissa_bits = num_mantissa_bits_
                 packing_format_letter = packing_format_letter_
@@ -248,12 +494,15 @@ class Float(BitType[float]):
         else:
 
             class _Float(cls):
+                __slots__ = ()
                 num_exponent_bits = num_exponent_bits_
                 num_mantissa_bits = num_mantissa_bits_
 
         if name_:
             _Float.__name__ = name_
+            _Float.__qualname__ = name_
 
+        cls._specializations[key] = _Float
         return _Float
 
     # Value operations
@@ -304,37 +553,131 @@ Float.base_bit_type = Float
 
 
 class Float16(StructPackedBitType, Float):
+    __slots__ = ()
+
     num_exponent_bits = 5
     num_mantissa_bits = 10
     packing_format_letter = "e"
 
 
 class Float32(StructPackedBitType, Float):
+    __slots__ = ()
+
     num_exponent_bits = 8
     num_mantissa_bits = 23
     packing_format_letter = "f"
 
 
 class Float64(StructPackedBitType, Float):
+    __slots__ = ()
+
     num_exponent_bits = 11
     num_mantissa_bits = 52
     packing_format_letter = "d"
 
 
+_FLOAT32_STRUCT = struct.Struct(">f")
+_UINT32_STRUCT = struct.Struct(">I")
+
+
+def _float_to_float32_int(value: float) -> int:
+    """
+    Returns the IEEE 754 float32 bit pattern of `value` as an int,
+        saturating values beyond float32's range to infinity.
+    """
+    try:
+        return _UINT32_STRUCT.unpack(_FLOAT32_STRUCT.pack(value))[0]
+    except OverflowError:
+        return _UINT32_STRUCT.unpack(
+            _FLOAT32_STRUCT.pack(math.copysign(math.inf, value))
+        )[0]
+
+
+def _float32_int_to_bfloat16_int(float32_int: int) -> int:
+    """
+    Returns the BFloat16 bit pattern (as an int) for a float32 bit pattern,
+        rounding to nearest even on the 16 dropped bits.
+    """
+    if float32_int & 0x7FFFFFFF > 0x7F800000:
+        # NaN
+        return 0x7FC0
+    return (float32_int + 0x7FFF + ((float32_int >> 16) & 1)) >> 16
+
+
 class BFloat16(Float):
     """
     Google Brain's BFloat16 format with 8 exponent bits and 7 mantissa bits.
+
+    A BFloat16 is the upper half of an IEEE 754 float32, so its value is converted
+        by reinterpreting it as one (rounding to nearest even when setting).
     """
 
+    __slots__ = ()
+
     num_exponent_bits = 8
     num_mantissa_bits = 7
 
+    @property
+    def value(self) -> float:
+        return _FLOAT32_STRUCT.unpack(self._bits.tobytes() + b"\x00\x00")[0]
+
+    @value.setter
+    def value(self, value):
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Expected a float or an int, got {type(value)}")
+        value = float(value)
+        bfloat16_int = _float32_int_to_bfloat16_int(_float_to_float32_int(value))
+        self.bits = BitVector(buffer=bfloat16_int.to_bytes(2, "big"))
+
+    @classmethod
+    def from_bytes_array(
+        cls, the_bytes: bytes, endianness: Literal["big", "little"] = "big"
+    ) -> List[float]:
+        if len(the_bytes) % 2 != 0:
+            raise ValueError(
+                f"Expected a multiple of {cls.num_bits} bits, got {len(the_bytes) * 8}"
+            )
+        count = len(the_bytes) // 2
+        # Widen every value to a float32 by appending two zero bytes
+        #   below its least significant byte
+        float32_bytes = bytearray(4 * count)
+        if endianness == "big":
+            float32_bytes[0::4] = the_bytes[0::2]
+            float32_bytes[1::4] = the_bytes[1::2]
+            return list(struct.unpack(f">{count}f", float32_bytes))
+        float32_bytes[2::4] = the_bytes[0::2]
+        float32_bytes[3::4] = the_bytes[1::2]
+        return list(struct.unpack(f"<{count}f", float32_bytes))
+
+    @classmethod
+    def to_bytes_array(
+        cls, values: Iterable[float], endianness: Literal["big", "little"] = "big"
+    ) -> bytes:
+        values = list(values)
+        count = len(values)
+        try:
+            float32_ints = struct.unpack(
+                f">{count}I", struct.pack(f">{count}f", *values)
+            )
+        except OverflowError:
+            float32_ints = [_float_to_float32_int(value) for value in values]
+        byte_order = ">" if endianness == "big" else "<"
+        return struct.pack(
+            f"{byte_order}{count}H",
+            *[
+                _float32_int_to_bfloat16_int(float32_int)
+                for float32_int in float32_ints
+            ],
+        )
+
 
 class TF19(Float):
     """
     NVidia's TensorFloat-19 format with 8 exponent bits and 10 mantissa bits.
     """
 
+    __slots__ = ()
+
     num_exponent_bits = 8
     num_mantissa_bits = 10
 
@@ -344,6 +687,8 @@ class FP24(Float):
     AMD's FP24 format with 7 exponent bits and 16 mantissa bits.
     """
 
+    __slots__ = ()
+
     num_exponent_bits = 7
     num_mantissa_bits = 16
 
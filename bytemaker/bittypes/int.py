@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import operator
-from math import ceil, log2
+from functools import singledispatch
 from typing import TYPE_CHECKING, Any
 
 from bytemaker.bittypes.bittype import BitType, StructPackedBitType
@@ -18,6 +18,40 @@ else:
         IntSelf = TypeVar("IntSelf", bound="Int")
 
 
+# The struct packing format letters of the byte-sized SInt{N}/UInt{N}
+_SINT_PACKING_FORMAT_LETTERS = {8: "b", 16: "h", 32: "i", 64: "q"}
+_UINT_PACKING_FORMAT_LETTERS = {8: "B", 16: "H", 32: "I", 64: "Q"}
+_PREDEFINED_NUM_BITS = (*range(1, 17), 32, 64, 128, 256)
+
+
+@singledispatch
+def _as_bitvector(source: BitType | BitsConstructible) -> BitVector:
+    """
+    Get the bits of a BitType or BitsConstructible object for `Int.to_pyint`,
+        dispatching on its type with a single registry lookup.
+    """
+    if is_instance_of_union(source, BitsConstructible):
+        return BitVector(source)
+    raise TypeError(f"Unsupported type: {type(source)}")
+
+
+@_as_bitvector.register(BitType)
+def _(source: BitType) -> BitVector:
+    return source._bits
+
+
+@_as_bitvector.register(BitVector)
+def _(source: BitVector) -> BitVector:
+    return source
+
+
+@_as_bitvector.register(str)
+@_as_bitvector.register(bytes)
+@_as_bitvector.register(bytearray)
+def _(source: str | bytes | bytearray) -> BitVector:
+    return BitVector(source)
+
+
 class Int(BitType[int]):
     """
     A `BitType` that represents an integer.
@@ -45,10 +79,31 @@ class Int(BitType[int]):
        The endianness of this `Int` object.
     """
 
+    __slots__ = ()
+
     py_type = int
     is_signed: Final[bool]
     """Whether the integer type is signed."""
 
+    _max_uns: int
+    """The largest unsigned value that fits in `num_bits` bits."""
+    _min_twos: int
+    """The smallest two's-complement value that fits in `num_bits` bits."""
+    _max_twos: int
+    """The largest two's-complement value that fits in `num_bits` bits."""
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precomputes the value ranges for the subclass's number of bits once,
+            so that conversions don't need to recompute them on every access.
+        """
+        super().__init_subclass__(**kwargs)
+        num_bits = cls._calculate_num_bits()
+        if num_bits is not None:
+            cls._max_uns = (1 << num_bits) - 1
+            cls._min_twos = -(1 << (num_bits - 1))
+            cls._max_twos = (1 << (num_bits - 1)) - 1
+
     def __int__(self):
         return self.value
 
@@ -62,6 +117,10 @@ class Int(BitType[int]):
         """
         Convert a bitstring to an integer.
 
+        The bits are read as one unsigned integer via `int.from_bytes`
+            (rather than by parsing a "01" string), and the sign is then applied
+            according to `bin_format`.
+
         Parameters:
         - bitstring (str): The bitstring to convert.
         - signed (Optional[bool], optional) Whether the bitstring represents
@@ -75,56 +134,61 @@ class Int(BitType[int]):
         """
 
         if signed is None:
-            bin_format_default = getattr(self, "is_signed", True)
-            assert isinstance(bin_format_default, bool)
-            signed = bin_format_default
-
-        if isinstance(self, BitType):
-            self = self.bits.to01()
-        elif isinstance(self, BitVector):
-            self = self.to01()
-        elif is_instance_of_union(self, BitsConstructible):
-            self = BitVector(self).to01()
-        else:
-            raise TypeError(f"Unsupported type: {type(self)}")
+            signed = getattr(type(self), "is_signed", True)
 
-        bitstring: str = self
+        bits = _as_bitvector(self)
 
-        if not bitstring:
+        if not bits:
             raise ValueError("bitstring cannot be empty")
 
-        bit_length = len(bitstring)
+        bit_length = len(bits)
+        # tobytes() zero-fills the trailing partial byte, so shift that fill away
+        unsigned_value = int.from_bytes(bits.tobytes(), "big") >> (-bit_length % 8)
 
         if not signed:
             # Unsigned integer
-            return int(bitstring, 2)
+            return unsigned_value
 
         # Signed integer handling
+        sign_bit = 1 << (bit_length - 1)
+        is_negative = unsigned_value & sign_bit
         if bin_format == "twos_complement":
             # Handle two's complement for signed integers
-            if bitstring[0] == "1":  # Negative number
-                int_value = -(2**bit_length) + int(bitstring, 2)
-            else:  # Positive number
-                int_value = int(bitstring, 2)
+            if is_negative:
+                int_value = unsigned_value - (1 << bit_length)
+            else:
+                int_value = unsigned_value
 
         elif bin_format == "signed_magnitude" or bin_format == "sign_magnitude":
             # Handle sign-magnitude for signed integers
-            if bitstring[0] == "1":  # Negative number
-                int_value = -int(bitstring[1:], 2)
-            else:  # Positive number
-                int_value = int(bitstring[1:], 2)
+            magnitude = unsigned_value & (sign_bit - 1)
+            int_value = -magnitude if is_negative else magnitude
 
         elif bin_format == "ones_complement":
             # Handle one's complement for signed integers
-            if bitstring[0] == "1":  # Negative number
-                int_value = -((2 ** (bit_length - 1)) - int(bitstring[1:], 2) - 1)
-            else:  # Positive number
-                int_value = int(bitstring, 2)
+            if is_negative:
+                int_value = -((sign_bit - 1) ^ (unsigned_value & (sign_bit - 1)))
+            else:
+                int_value = unsigned_value
         else:
             raise ValueError(f"Unsupported format: {bin_format}")
 
         return int_value
 
+    @staticmethod
+    def _bits_to_twos_int(bits: BitVector) -> int:
+        """
+        Read a non-empty BitVector as a big-endian two's-complement integer.
+
+        A faster equivalent of `to_pyint(bits, signed=True)` that skips
+            the argument dispatch.
+        """
+        num_bits = len(bits)
+        result = int.from_bytes(bits.tobytes(), "big") >> (-num_bits % 8)
+        if result >> (num_bits - 1):
+            result -= 1 << num_bits
+        return result
+
     @staticmethod
     def min_bit_length(
         value: int,
@@ -151,34 +215,27 @@ class Int(BitType[int]):
         if not signed:
             if n == 0:
                 return 1
-            return ceil(log2(n + 1))
+            return n.bit_length()
         else:
             if bin_format is None:
                 bin_format = "twos_complement"
 
             if bin_format == "twos_complement":
-                if n == 0:
-                    return 1  # Technically can represent 0 with 0 bits in
-                    # two's complement, but this is not useful
-
-                is_greq_than_zero = n >= 0
-                abs_val = abs(n)
-                is_power_of_two = (abs_val & (abs_val - 1)) == 0
-
-                if is_greq_than_zero or not is_power_of_two:
-                    return ceil(log2(abs_val + 1)) + 1  # Account for extra
-                    # at negative extreme
-                else:
-                    return int(log2(abs_val)) + 1
+                # k bits hold -2**(k-1) <= n < 2**(k-1), so n needs one more bit
+                # than its magnitude (~n == -n - 1 for negatives) for the sign.
+                # 0 yields 1 (technically 0 bits, but that is not useful).
+                if n >= 0:
+                    return n.bit_length() + 1
+                return (~n).bit_length() + 1
             elif bin_format == "signed_magnitude" or bin_format == "sign_magnitude":
                 if n == 0:
                     return 1
-                return ceil(log2(abs(n) + 1)) + 1
+                return abs(n).bit_length() + 1
             elif bin_format == "ones_complement":
                 if n == 0:
                     return 1  # Technically can represent 0 with 0 bits in
                     # one's complement, but this is not useful
-                return ceil(log2(abs(n) + 1)) + 1
+                return abs(n).bit_length() + 1
 
     def to_bitstring(
         self: Int | int,
@@ -203,26 +260,67 @@ class Int(BitType[int]):
         Returns:
         - str: The bitstring representation of the integer.
         """
+        bit_pattern, bit_length = Int._to_bit_pattern(
+            self, signed, bit_length, rep_format
+        )
+        return format(bit_pattern, f"0{bit_length}b")
+
+    def to_bitvector(
+        self: Int | int,
+        signed: bool = True,
+        bit_length: Optional[int] = None,
+        rep_format: Optional[
+            Literal["twos_complement", "signed_magnitude", "ones_complement"]
+        ] = None,
+    ) -> BitVector:
+        """
+        Convert an integer to a BitVector, without building a bitstring in between.
+
+        Parameters are the same as those of `to_bitstring`.
+
+        Returns:
+        - BitVector: The bits representing the integer.
+        """
+        bit_pattern, bit_length = Int._to_bit_pattern(
+            self, signed, bit_length, rep_format
+        )
+        return BitVector.from_uint(bit_pattern, bit_length)
 
-        def unsigned_int_to_bitstring(n: int, bit_length: int):
-            if n < 0 or n >= 2**bit_length:
+    @staticmethod
+    def _to_bit_pattern(
+        value: Int | int,
+        signed: bool,
+        bit_length: Optional[int],
+        rep_format: Optional[
+            Literal["twos_complement", "signed_magnitude", "ones_complement"]
+        ],
+    ) -> tuple[int, int]:
+        """
+        Range-check an integer and encode it as the unsigned integer whose
+            `bit_length`-bit binary representation is the integer's representation.
+
+        Returns:
+        - tuple[int, int]: The unsigned bit pattern and the (resolved) bit length.
+        """
+
+        def unsigned_int_to_bit_pattern(n: int, bit_length: int):
+            if n < 0 or n >> bit_length:
                 raise ValueError("Value out of range for the specified bit_length")
-            return bin(n)[2:].zfill(bit_length)
+            return n
 
         def int_to_twos_complement(n: int, bit_length: int):
             """
-            Convert a signed integer to its two's complement binary string
-                representation.
+            Convert a signed integer to its two's complement bit pattern.
 
             Args:
             z (int): The signed integer to convert.
             bit_length (int): The bit length of the two's complement representation.
 
             Returns:
-            str: The two's complement binary string representation of the integer.
+            int: The two's complement bit pattern of the integer.
             """
 
-            if n < -(2 ** (bit_length - 1)) or n >= 2 ** (bit_length - 1):
+            if not -(1 << (bit_length - 1)) <= n < 1 << (bit_length - 1):
                 raise ValueError(
                     "Value out of range for the specified bit_length"
                     " for two's-complement notation."
@@ -230,40 +328,39 @@ class Int(BitType[int]):
 
             if n < 0:
                 # Calculate two's complement for negative numbers
-                n = 2**bit_length + n
-            return format(n, f"0{bit_length}b")
+                n += 1 << bit_length
+            return n
 
         def int_to_ones_complement(n: int, bit_length: int):
-            if abs(n) > 2 ** (bit_length - 1) - 1:
+            mask = (1 << bit_length) - 1
+            if abs(n) > mask >> 1:
                 raise ValueError(
                     "Value out of range for the specified bit_length"
                     " for one's-complement notation."
                 )
 
-            magnitude_string = unsigned_int_to_bitstring(abs(n), bit_length)
             if n >= 0:
-                return magnitude_string
+                return n
             else:
-                return "".join(
-                    "0" if digit == "1" else "1" for digit in magnitude_string
-                )
+                # Invert every bit of the magnitude
+                return mask ^ -n
 
         def int_to_signed_magnitude(n: int, bit_length: int):
-            if abs(n) > 2 ** (bit_length - 1) - 1:
+            if abs(n) >> (bit_length - 1):
                 raise ValueError(
                     "Value out of range for the specified bit_length"
                     " for sign-magnitude notation."
                 )
 
             if n >= 0:
-                return "0" + unsigned_int_to_bitstring(n, bit_length - 1)
+                return n
             else:
-                return "1" + unsigned_int_to_bitstring(-n, bit_length - 1)
+                return (1 << (bit_length - 1)) | -n
 
-        if isinstance(self, Int):
-            value = self.value
-        elif isinstance(self, int):
-            value = int(self)
+        if isinstance(value, Int):
+            value = value.value
+        elif isinstance(value, int):
+            value = int(value)
 
         if signed and rep_format is None:
             rep_format = "twos_complement"
@@ -275,17 +372,16 @@ class Int(BitType[int]):
             raise ValueError("bit_length must be a positive integer")
 
         if not signed:
-            return unsigned_int_to_bitstring(value, bit_length)
-
-        if signed:
-            if rep_format == "twos_complement":
-                return int_to_twos_complement(value, bit_length)
-            elif rep_format == "signed_magnitude" or rep_format == "sign_magnitude":
-                return int_to_signed_magnitude(value, bit_length)
-            elif rep_format == "ones_complement":
-                return int_to_ones_complement(value, bit_length)
-            else:
-                raise ValueError(f"Unsupported format: {rep_format}")
+            return unsigned_int_to_bit_pattern(value, bit_length), bit_length
+
+        if rep_format == "twos_complement":
+            return int_to_twos_complement(value, bit_length), bit_length
+        elif rep_format == "signed_magnitude" or rep_format == "sign_magnitude":
+            return int_to_signed_magnitude(value, bit_length), bit_length
+        elif rep_format == "ones_complement":
+            return int_to_ones_complement(value, bit_length), bit_length
+        else:
+            raise ValueError(f"Unsupported format: {rep_format}")
 
     # Integer value magic methods
     def __add__(self: IntSelf, other: Any) -> IntSelf:
@@ -424,6 +520,8 @@ class SInt(Int):
             The bits representing the value.
     """
 
+    __slots__ = ("int_format",)
+
     is_signed = True
 
     def __init__(
@@ -449,18 +547,61 @@ class SInt(Int):
     # def int_format(cls) -> str:
     #     return Config.signed_int_format
 
+    @classmethod
+    def _new_from_bits(
+        cls: type[IntSelf],
+        bits: BitVector,
+        endianness: Literal["big", "little"] = "big",
+    ) -> IntSelf:
+        self = super()._new_from_bits(bits, endianness)
+        self.int_format = SignedConfig.signed_int_format
+        return self
+
+    @classmethod
+    def _new_from_value(
+        cls: type[IntSelf],
+        value: int,
+        endianness: Literal["big", "little"] = "big",
+        int_format: Optional[
+            Literal["twos_complement", "signed_magnitude", "ones_complement"]
+        ] = None,
+    ) -> IntSelf:
+        self = cls.__new__(cls)
+        # Set before the value, since the value setter encodes according to it
+        self.int_format = (
+            SignedConfig.signed_int_format if int_format is None else int_format
+        )
+        self._endianness = endianness
+        self.value = value
+        return self
+
+    def _new_from_result(self: IntSelf, value: int) -> IntSelf:
+        return type(self)._new_from_value(value, int_format=self.int_format)
+
+    def _decodes_like(self: IntSelf, other: IntSelf) -> bool:
+        return super()._decodes_like(other) and self.int_format == other.int_format
+
     @property
     def value(self):
-        return Int.to_pyint(self.bits.to01(), signed=True, bin_format=self.int_format)
+        if self.int_format == "twos_complement":
+            return Int._bits_to_twos_int(self._bits)
+        return Int.to_pyint(self._bits, signed=True, bin_format=self.int_format)
 
     @value.setter
     def value(self, value):
-        str_bits = Int.to_bitstring(
+        if self.int_format == "twos_complement":
+            if not self._min_twos <= value <= self._max_twos:
+                raise ValueError(
+                    "Value out of range for the specified bit_length"
+                    " for two's-complement notation."
+                )
+            self._bits = BitVector.from_uint(value & self._max_uns, self.num_bits)
+            return
+
+        self.bits = Int.to_bitvector(
             value, signed=True, bit_length=self.num_bits, rep_format=self.int_format
         )
 
-        self.bits = BitVector(str_bits)
-
     @classmethod
     def specialize(
         cls,
@@ -478,6 +619,8 @@ class SInt(Int):
         If name_ is provided, the subclass will have that name internally after class
             creation. Otherwise, the subclass will be named _SInt.
 
+        Repeated calls with the same arguments return the same subclass.
+
         Args:
             num_bits_ (int): The number of bits in integers of this type.
             packing_format_letter_ (Optional[str], optional): The struct packing format
@@ -488,9 +631,14 @@ class SInt(Int):
         Returns:
             type[SInt]: The subclass of SInt with the specified number of bits.
         """
+        key = (num_bits_, packing_format_letter_, name_)
+        if key in cls._specializations:
+            return cls._specializations[key]
+
         if packing_format_letter_ is not None:
 
             class _SInt(StructPackedBitType[int], cls):
+                __slots__ = ()
                 _num_bits = num_bits_
                 packing_format_letter = packing_format_letter_
 
@@ -501,115 +649,42 @@ class SInt(Int):
         else:
 
             class _SInt(cls):
+                __slots__ = ()
                 _num_bits = num_bits_
 
         if name_ is not None:
             _SInt.__name__ = name_
+            _SInt.__qualname__ = name_
 
+        cls._specializations[key] = _SInt
         return _SInt
 
+    def __class_getitem__(cls, num_bits_: int):
+        """
+        Returns the subclass of SInt with the specified number of bits,
+            e.g. `SInt[8]` is `SInt8`.
+        Byte-sized widths of 8, 16, 32 and 64 bits are struct-packed.
 
-SInt.base_bit_type = SInt
-
-
-class SInt1(SInt):
-    _num_bits = 1
-
-
-class SInt2(SInt):
-    _num_bits = 2
-
-
-class SInt3(SInt):
-    _num_bits = 3
-
-
-class SInt4(SInt):
-    _num_bits = 4
-
-
-class SInt5(SInt):
-    _num_bits = 5
-
-
-class SInt6(SInt):
-    _num_bits = 6
-
-
-class SInt7(SInt):
-    _num_bits = 7
-
-
-class SInt8(StructPackedBitType, SInt):
-    _num_bits = 8
-    packing_format_letter = "b"
-
-    @property
-    def skip_struct_packing(self):
-        return SignedConfig.signed_int_format != "twos_complement"
-
-
-class SInt9(SInt):
-    _num_bits = 9
-
-
-class SInt10(SInt):
-    _num_bits = 10
-
-
-class SInt11(SInt):
-    _num_bits = 11
-
-
-class SInt12(SInt):
-    _num_bits = 12
-
-
-class SInt13(SInt):
-    _num_bits = 13
-
-
-class SInt14(SInt):
-    _num_bits = 14
-
-
-class SInt15(SInt):
-    _num_bits = 15
-
-
-class SInt16(StructPackedBitType, SInt):
-    _num_bits = 16
-    packing_format_letter = "h"
-
-    @property
-    def skip_struct_packing(self):
-        return SignedConfig.signed_int_format != "twos_complement"
-
-
-class SInt32(StructPackedBitType, SInt):
-    _num_bits = 32
-    packing_format_letter = "i"
-
-    @property
-    def skip_struct_packing(self):
-        return SignedConfig.signed_int_format != "twos_complement"
-
-
-class SInt64(StructPackedBitType, SInt):
-    _num_bits = 64
-    packing_format_letter = "q"
+        Args:
+            num_bits_ (int): The number of bits in integers of this type.
 
-    @property
-    def skip_struct_packing(self):
-        return SignedConfig.signed_int_format != "twos_complement"
+        Returns:
+            type[SInt]: The subclass of SInt with the specified number of bits.
+        """
+        return cls.specialize(
+            num_bits_,
+            _SINT_PACKING_FORMAT_LETTERS.get(num_bits_),
+            f"{cls.__name__}{num_bits_}",
+        )
 
 
-class SInt128(SInt):
-    _num_bits = 128
+SInt.base_bit_type = SInt
 
 
-class SInt256(SInt):
-    _num_bits = 256
+# The pre-defined subclasses (SInt1, SInt2, ...) are memoized specializations
+for _num_bits in _PREDEFINED_NUM_BITS:
+    globals()[f"SInt{_num_bits}"] = SInt[_num_bits]
+del _num_bits
 
 
 class UInt(Int):
@@ -629,15 +704,18 @@ class UInt(Int):
         bits (BitVector): The bits representing the integer value.
     """
 
+    __slots__ = ()
+
     is_signed = False
 
     @property
     def value(self):
-        return int(self.bits.to01(), 2)
+        bits = self._bits
+        return int.from_bytes(bits.tobytes(), "big") >> (-len(bits) % 8)
 
     @value.setter
     def value(self, value):
-        self._bits = BitVector(bin(value)[2:])
+        self._bits = BitVector.from_uint(value, self.num_bits)
 
     @classmethod
     def specialize(
@@ -656,6 +734,8 @@ class UInt(Int):
         If name_ is provided, the subclass will have that name internally after class
             creation. Otherwise, the subclass will be named _UInt.
 
+        Repeated calls with the same arguments return the same subclass.
+
         Args:
             num_bits_ (int): The number of bits in integers of this type.
             packing_format_letter_ (Optional[str], optional): The struct packing format
@@ -666,153 +746,60 @@ class UInt(Int):
         Returns:
             type[UInt]: The subclass of UInt with the specified number of bits.
         """
+        key = (num_bits_, packing_format_letter_, name_)
+        if key in cls._specializations:
+            return cls._specializations[key]
+
         if packing_format_letter_ is not None:
 
             class _UInt(StructPackedBitType[int], cls):
+                __slots__ = ()
                 _num_bits = num_bits_
                 packing_format_letter = packing_format_letter_
 
         else:
 
             class _UInt(cls):
+                __slots__ = ()
                 _num_bits = num_bits_
 
         if name_ is not None:
             _UInt.__name__ = name_
+            _UInt.__qualname__ = name_
 
+        cls._specializations[key] = _UInt
         return _UInt
 
+    def __class_getitem__(cls, num_bits_: int):
+        """
+        Returns the subclass of UInt with the specified number of bits,
+            e.g. `UInt[8]` is `UInt8`.
+        Byte-sized widths of 8, 16, 32 and 64 bits are struct-packed.
 
-UInt.base_bit_type = UInt
-
-
-class UInt1(UInt):
-    _num_bits = 1
-
-
-class UInt2(UInt):
-    _num_bits = 2
-
-
-class UInt3(UInt):
-    _num_bits = 3
-
-
-class UInt4(UInt):
-    _num_bits = 4
-
-
-class UInt5(UInt):
-    _num_bits = 5
-
-
-class UInt6(UInt):
-    _num_bits = 6
-
-
-class UInt7(UInt):
-    _num_bits = 7
-
-
-class UInt8(StructPackedBitType, UInt):
-    _num_bits = 8
-    packing_format_letter = "B"
-
-
-class UInt9(UInt):
-    _num_bits = 9
-
-
-class UInt10(UInt):
-    _num_bits = 10
-
-
-class UInt11(UInt):
-    _num_bits = 11
-
-
-class UInt12(UInt):
-    _num_bits = 12
-
-
-class UInt13(UInt):
-    _num_bits = 13
-
-
-class UInt14(UInt):
-    _num_bits = 14
-
-
-class UInt15(UInt):
-    _num_bits = 15
-
-
-class UInt16(StructPackedBitType, UInt):
-    _num_bits = 16
-    packing_format_letter = "H"
-
-
-class UInt32(StructPackedBitType, UInt):
-    _num_bits = 32
-    packing_format_letter = "I"
-
+        Args:
+            num_bits_ (int): The number of bits in integers of this type.
 
-class UInt64(StructPackedBitType, UInt):
-    _num_bits = 64
-    packing_format_letter = "Q"
+        Returns:
+            type[UInt]: The subclass of UInt with the specified number of bits.
+        """
+        return cls.specialize(
+            num_bits_,
+            _UINT_PACKING_FORMAT_LETTERS.get(num_bits_),
+            f"{cls.__name__}{num_bits_}",
+        )
 
 
-class UInt128(UInt):
-    _num_bits = 128
+UInt.base_bit_type = UInt
 
 
-class UInt256(UInt):
-    _num_bits = 256
+# The pre-defined subclasses (UInt1, UInt2, ...) are memoized specializations
+for _num_bits in _PREDEFINED_NUM_BITS:
+    globals()[f"UInt{_num_bits}"] = UInt[_num_bits]
+del _num_bits
 
 
-__all__ = [
-    "Int",
-    "SInt",
-    "UInt",
-    "SignedConfig",
-    "SInt1",
-    "SInt2",
-    "SInt3",
-    "SInt4",
-    "SInt5",
-    "SInt6",
-    "SInt7",
-    "SInt8",
-    "SInt9",
-    "SInt10",
-    "SInt11",
-    "SInt12",
-    "SInt13",
-    "SInt14",
-    "SInt15",
-    "SInt16",
-    "SInt32",
-    "SInt64",
-    "SInt128",
-    "SInt256",
-    "UInt1",
-    "UInt2",
-    "UInt3",
-    "UInt4",
-    "UInt5",
-    "UInt6",
-    "UInt7",
-    "UInt8",
-    "UInt9",
-    "UInt10",
-    "UInt11",
-    "UInt12",
-    "UInt13",
-    "UInt14",
-    "UInt15",
-    "UInt16",
-    "UInt32",
-    "UInt64",
-    "UInt128",
-    "UInt256",
-]
+__all__ = (
+    ["Int", "SInt", "UInt", "SignedConfig"]
+    + [f"SInt{num_bits}" for num_bits in _PREDEFINED_NUM_BITS]
+    + [f"UInt{num_bits}" for num_bits in _PREDEFINED_NUM_BITS]
+)
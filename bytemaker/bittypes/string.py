@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import codecs
 import re
 from abc import abstractmethod
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING
 
 from bytemaker.bittypes.bittype import BitType
 from bytemaker.bitvector import BitVector
-from bytemaker.typing_redirect import Optional, Tuple, TypeVar
-from bytemaker.utils import FrozenDict, HashableMapping, classproperty
+from bytemaker.typing_redirect import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from bytemaker.utils import FrozenDict, HashableMapping, Trie, classproperty
 
 if TYPE_CHECKING:
     StrSelf = TypeVar("StrSelf", bound="String")
@@ -18,17 +29,174 @@ else:
         StrSelf = TypeVar("StrSelf", bound="String")
 
 
+def _trie_pattern(node: Trie, is_root: bool = False) -> str:
+    """
+    Builds the regex source matching the keys below `node` of a prefix trie,
+        with each shared prefix spelled out only once (e.g. "ab(?:c|d)").
+    Where one key is a prefix of another, the longer key is preferred.
+    """
+    # Alphanumeric characters are never special, so they skip `re.escape`
+    alternatives = [
+        (char if char.isalnum() else re.escape(char)) + _trie_pattern(child)
+        for char, child in node.children.items()
+    ]
+    if not alternatives:
+        return ""
+    if node.is_start_of_prefix:
+        return "(?:" + "|".join(alternatives) + ")?"
+    if len(alternatives) == 1 or is_root:
+        return "|".join(alternatives)
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+def _compile_keys_regex(keys: Iterable[str]) -> re.Pattern[str]:
+    """
+    Compiles a regex matching any of `keys`.
+
+    The keys are factored through a prefix trie,
+        so that the regex engine tries each distinct prefix once per position
+        instead of once per key.
+    """
+    return re.compile(_trie_pattern(Trie.build_prefix_trie(keys), is_root=True))
+
+
+def _match_replacer(
+    codepoint_changes: HashableMapping[str, str]
+) -> Callable[[re.Match[str]], str]:
+    """
+    Builds an `re.sub` replacement function that maps each match through
+        `codepoint_changes`, with the lookup bound to a plain dict's `__getitem__`.
+    """
+    lookup = dict(codepoint_changes).__getitem__
+    return lambda match: lookup(match.group())
+
+
+_SubstitutionState = Tuple[
+    Optional[Dict[int, str]], Optional[Callable[[str], str]], "frozenset[str]"
+]
+"""
+How `String.value` applies one direction of the codepoint changes:
+    a `str.translate` table, or else a bound regex `sub`
+    along with the first characters of the keys it matches.
+"""
+
+_NO_SUBSTITUTION: _SubstitutionState = (None, None, frozenset())
+
+_BATCH_SEPARATOR = "\x1f"
+"""The separator (ASCII unit separator) joining decoded strings in `values_batch`."""
+
+_MAX_CACHED_ENCODING_LEN = 256
+"""The longest strings whose encoded bits are cached by `StandardEncodingString`."""
+
+
+@lru_cache(maxsize=None)
+def _cached_encoder(encoding_name: str) -> Callable[[str], BitVector]:
+    """
+    Builds the encoding function shared by every `StandardEncodingString`
+        subclass using the codec `encoding_name`, with a bounded cache of results.
+
+    Sharing the resulting BitVectors is safe since BitVectors wrapping `bytes` are
+        read-only.
+    """
+    encode = codecs.lookup(encoding_name).encode
+
+    @lru_cache(maxsize=1024)
+    def cached_encoding(value: str) -> BitVector:
+        return BitVector(encode(value)[0])
+
+    return cached_encoding
+
+
 class String(BitType[str]):
+    __slots__ = ()
+
     py_type = str
     _codepoint_changes: Optional[
         HashableMapping[BitVector, BitVector] | HashableMapping[str, str]
     ] = None
-    _codepoint_changes_cache: Optional[Tuple[int, HashableMapping[str, str]]] = None
-    _reverse_codepoint_changes_cache: Optional[
-        Tuple[int, HashableMapping[str, str]]
-    ] = None
-    _codepoint_change_regex_cache: Optional[Tuple[int, re.Pattern[str]]] = None
-    _reverse_codepoint_changes_regex_cache: Optional[Tuple[int, re.Pattern[str]]] = None
+    _cp_fwd: Optional[HashableMapping[str, str]] = None
+    _cp_rev: Optional[HashableMapping[str, str]] = None
+    _cp_fwd_re: Optional[re.Pattern[str]] = None
+    _cp_rev_re: Optional[re.Pattern[str]] = None
+    _cp_fwd_state: _SubstitutionState = _NO_SUBSTITUTION
+    _cp_rev_state: _SubstitutionState = _NO_SUBSTITUTION
+    _cp_fwd_joinable: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precomputes the codepoint-substitution tables and regexes once per subclass,
+            so that `value` doesn't rebuild them on every access.
+        Every subclass gets all of them in its own `__dict__`.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._compile_codepoint_changes()
+
+    @classmethod
+    def _compile_codepoint_changes(cls):
+        """
+        (Re)computes the str->str codepoint changes, their reverse,
+            and the regexes matching their keys from `cls._codepoint_changes`.
+
+        When every key and value is a single character, `str.translate` tables
+            are built as well, and `value` uses those instead of the regexes.
+            Otherwise, `value` uses the regexes' `sub` with a replacement function
+            bound once here, skipping it for strings containing none of the
+            keys' first characters.
+
+        Each direction's substitution state is built off to the side and then
+            published with a single assignment, so that `value` never sees
+            a mix of the old and new state while the changes are being replaced.
+        """
+        codepoint_changes = cls._codepoint_changes
+        if not codepoint_changes:
+            cls._cp_fwd = cls._cp_rev = cls._cp_fwd_re = cls._cp_rev_re = None
+            cls._cp_fwd_state = cls._cp_rev_state = _NO_SUBSTITUTION
+            cls._cp_fwd_joinable = True
+            return
+
+        if isinstance(next(iter(codepoint_changes)), BitVector):
+            codepoint_changes = FrozenDict(
+                {cls.decoding(k): cls.decoding(v) for k, v in codepoint_changes.items()}
+            )
+        reverse_codepoint_changes = FrozenDict(
+            {v: k for k, v in codepoint_changes.items()}
+        )
+
+        fwd_re = _compile_keys_regex(codepoint_changes.keys())
+        rev_re = _compile_keys_regex(reverse_codepoint_changes.keys())
+        if all(len(k) == 1 and len(v) == 1 for k, v in codepoint_changes.items()):
+            fwd_state: _SubstitutionState = (
+                str.maketrans(dict(codepoint_changes)),
+                None,
+                frozenset(),
+            )
+            rev_state: _SubstitutionState = (
+                str.maketrans(dict(reverse_codepoint_changes)),
+                None,
+                frozenset(),
+            )
+        else:
+            fwd_state = (
+                None,
+                partial(fwd_re.sub, _match_replacer(codepoint_changes)),
+                frozenset(k[:1] for k in codepoint_changes),
+            )
+            rev_state = (
+                None,
+                partial(rev_re.sub, _match_replacer(reverse_codepoint_changes)),
+                frozenset(k[:1] for k in reverse_codepoint_changes),
+            )
+
+        cls._cp_fwd = codepoint_changes
+        cls._cp_rev = reverse_codepoint_changes
+        cls._cp_fwd_re = fwd_re
+        cls._cp_rev_re = rev_re
+        cls._cp_fwd_joinable = not any(
+            _BATCH_SEPARATOR in k or _BATCH_SEPARATOR in v
+            for k, v in codepoint_changes.items()
+        )
+        cls._cp_fwd_state = fwd_state
+        cls._cp_rev_state = rev_state
 
     @classmethod
     @abstractmethod
@@ -70,104 +238,19 @@ class String(BitType[str]):
         Returns:
             Optional[HashableMapping[str, str]]: The codepoint changes mapping
         """
-        if cls._codepoint_changes is None:
-            return None
-        if cls._codepoint_changes_cache and cls._codepoint_changes_cache[0] == hash(
-            cls._codepoint_changes
-        ):
-            return cls._codepoint_changes_cache[1]
-
-        codepoint_changes_field = cls._codepoint_changes
-        if len(codepoint_changes_field) > 0:
-            if isinstance(
-                codepoint_changes_field.items().__iter__().__next__()[0], BitVector
-            ):
-                codepoint_changes_field = FrozenDict(
-                    {
-                        cls.decoding(k): cls.decoding(v)
-                        for k, v in codepoint_changes_field.items()
-                    }
-                )
-
-        cls._codepoint_changes_cache = (
-            hash(cls._codepoint_changes),
-            codepoint_changes_field,
-        )  # type: ignore[reportAttributeAccessIssue]
-
-    @classproperty
-    @classmethod
-    def _reverse_codepoint_changes(cls) -> Optional[HashableMapping[str, str]]:
-        if cls._codepoint_changes is None:
-            return None
-        if cls._reverse_codepoint_changes_cache and (
-            cls._reverse_codepoint_changes_cache[0] == hash(cls._codepoint_changes)
-        ):
-            return cls._reverse_codepoint_changes_cache[1]
-
-        codepoint_changes = cls.codepoint_changes
-        reverse_codepoint_changes = FrozenDict(
-            {v: k for k, v in codepoint_changes.items()}
-        )
-        cls._reverse_codepoint_changes_cache = (
-            hash(cls._codepoint_changes),
-            reverse_codepoint_changes,
-        )
-
-    @classproperty
-    @classmethod
-    def _codepoint_change_regex(cls) -> Optional[re.Pattern]:
-        if cls.codepoint_changes:
-            if cls._codepoint_change_regex_cache and cls._codepoint_change_regex_cache[
-                0
-            ] == hash(cls.codepoint_changes):
-                return cls._codepoint_change_regex_cache[1]
-            else:
-                cls._codepoint_change_regex_cache = (
-                    hash(cls.codepoint_changes),
-                    re.compile(
-                        "|".join(re.escape(key) for key in cls.codepoint_changes.keys())
-                    ),
-                )
-            return cls._codepoint_change_regex_cache[1]
-        return None
-
-    @classproperty
-    @classmethod
-    def _reverse_codepoint_change_regex(cls) -> Optional[re.Pattern]:
-        if cls.codepoint_changes:
-            if cls._reverse_codepoint_changes_regex_cache and (
-                cls._reverse_codepoint_changes_regex_cache[0]
-                == hash(cls.codepoint_changes)
-            ):
-                return cls._reverse_codepoint_changes_regex_cache[1]
-            else:
-                cls._reverse_codepoint_changes_regex_cache = (
-                    hash(cls.codepoint_changes),
-                    re.compile(
-                        "|".join(
-                            re.escape(key) for key in cls.codepoint_changes.values()
-                        )
-                    ),
-                )
-            return cls._reverse_codepoint_changes_regex_cache[1]
-        return None
+        return cls._cp_fwd
 
     @codepoint_changes.setter
     @classmethod
     def codepoint_changes(
         cls, value: (HashableMapping[BitVector, BitVector] | HashableMapping[str, str])
     ):
-        if len(value) > 0:
-            if isinstance(value.items().__iter__().__next__()[0], BitVector):
-                value = FrozenDict(
-                    {cls.decoding(k): cls.decoding(v) for k, v in value.items()}
-                )
-
+        # BitVector keys and values are decoded once, by the compilation
         cls._codepoint_changes = value
+        cls._compile_codepoint_changes()
 
-    @classmethod
+    @staticmethod
     def perform_codepoint_substitution(
-        cls,
         input_string,
         codepoint_changes: HashableMapping[str, str],
         changes_regex: re.Pattern[str],
@@ -184,42 +267,98 @@ class String(BitType[str]):
         Returns:
             str: The input string with codepoint substitutions applied
         """
-        return changes_regex.sub(
-            lambda match: codepoint_changes[match.group(0)], input_string
-        )
+        return changes_regex.sub(_match_replacer(codepoint_changes), input_string)
 
     @property
     def value(self):
-        temp_value = self.decoding(self.bits)
-        codepoint_changes = self.codepoint_changes
-        if codepoint_changes is not None:
-            codepoint_changes_regex: re.Pattern[str] = self._codepoint_change_regex
-            temp_value = self.perform_codepoint_substitution(
-                temp_value, codepoint_changes, codepoint_changes_regex
-            )
+        temp_value = self.decoding(self._bits)
+        table, sub, first_chars = self._cp_fwd_state
+        if table is not None:
+            temp_value = temp_value.translate(table)
+        elif sub is not None and not first_chars.isdisjoint(temp_value):
+            temp_value = sub(temp_value)
         return temp_value
 
     @value.setter
     def value(self, value):
         temp_value = value
-        reverse_codepoint_changes = self._reverse_codepoint_changes
-        if reverse_codepoint_changes is not None:
-            reverse_codepoint_changes_regex: re.Pattern[
-                str
-            ] = self._reverse_codepoint_change_regex
-            temp_value = self.perform_codepoint_substitution(
-                temp_value, reverse_codepoint_changes, reverse_codepoint_changes_regex
-            )
+        table, sub, first_chars = self._cp_rev_state
+        if table is not None:
+            temp_value = temp_value.translate(table)
+        elif sub is not None and not first_chars.isdisjoint(temp_value):
+            temp_value = sub(temp_value)
         self.bits = self.encoding(temp_value)
 
+    @classmethod
+    def _decode_joined(cls, bits_list: List[BitVector]) -> str:
+        """
+        Decodes each of `bits_list`, joining the results with `_BATCH_SEPARATOR`.
+        """
+        return _BATCH_SEPARATOR.join(map(cls.decoding, bits_list))
+
+    @classmethod
+    def values_batch(cls, instances: Sequence[String]) -> List[str]:
+        """
+        Gives the values of a sequence of instances of this class,
+            like `[instance.value for instance in instances]`.
+
+        The decoded strings are joined so that the codepoint substitutions run
+            once over all of them, rather than once per instance.
+        Each value is read separately instead when a decoded string or a
+            codepoint change contains the separator.
+
+        Args:
+            instances (Sequence[String]): The instances, all of this exact class.
+
+        Returns:
+            List[str]: The instances' values, in order.
+        """
+        if not instances:
+            return []
+        table, sub, _ = cls._cp_fwd_state
+        joined = cls._decode_joined([instance._bits for instance in instances])
+        if (
+            not cls._cp_fwd_joinable
+            or joined.count(_BATCH_SEPARATOR) != len(instances) - 1
+        ):
+            return [instance.value for instance in instances]
+        if table is not None:
+            joined = joined.translate(table)
+        elif sub is not None:
+            joined = sub(joined)
+        return joined.split(_BATCH_SEPARATOR)
+
     @classmethod
     def specialize(cls, num_bits_: int, name_: Optional[str] = None):
+        """
+        Produce a subclass of this String class with the specified number of bits.
+
+        If name_ is provided, the subclass will have that name internally after class
+            creation. Otherwise, the subclass will be named _String.
+
+        Repeated calls with the same arguments return the same subclass.
+
+        Args:
+            num_bits_ (int): The number of bits in strings of this type.
+            name_ (Optional[str], optional): What to rename the subclass, if anything.
+                Defaults to None, meaning the subclass's name will be _String.
+
+        Returns:
+            type[String]: The subclass with the specified number of bits.
+        """
+        key = (num_bits_, name_)
+        if key in cls._specializations:
+            return cls._specializations[key]
+
         class _String(cls):
+            __slots__ = ()
             _num_bits = num_bits_
 
         if name_:
             _String.__name__ = name_
+            _String.__qualname__ = name_
 
+        cls._specializations[key] = _String
         return _String
 
 
@@ -231,130 +370,90 @@ class StandardEncodingString(String):
     A class for strings that use a standard Python encoding (str.encode/decode)
     """
 
+    __slots__ = ()
+
     py_type = str
     encoding_name: str
     """The name of the Python-supported encoding to use for encoding/decoding."""
 
+    _encode: Callable[[str], Tuple[bytes, int]]
+    _decode: Callable[[bytes], Tuple[str, int]]
+    _cached_encoding: Callable[[str], BitVector]
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Looks up the codec for the subclass's `encoding_name` once,
+            so that encoding/decoding skip the codec registry on every call.
+        """
+        # Set before String's hook, which may decode the codepoint changes
+        encoding_name = getattr(cls, "encoding_name", None)
+        if encoding_name is not None:
+            codec_info = codecs.lookup(encoding_name)
+            cls._encode = staticmethod(codec_info.encode)
+            cls._decode = staticmethod(codec_info.decode)
+            cls._cached_encoding = staticmethod(_cached_encoder(codec_info.name))
+        super().__init_subclass__(**kwargs)
+
     @classmethod
     def encoding(cls, value: str) -> BitVector:
-        return BitVector(value.encode(cls.encoding_name))
+        if len(value) <= _MAX_CACHED_ENCODING_LEN:
+            return cls._cached_encoding(value)
+        return BitVector(cls._encode(value)[0])
 
     @classmethod
     def decoding(cls, bits: BitVector) -> str:
-        return bytes(bits).decode(cls.encoding_name)
+        # Byte-aligned bits are decoded straight from their buffer, without a copy
+        return cls._decode(bits if not bits.padbits else bits.tobytes())[0]
 
 
 class UTF8String(StandardEncodingString):
-    encoding_name = "utf-8"
-
-
-class Str1(UTF8String):
-    _num_bits = 1
-
-
-class Str2(UTF8String):
-    _num_bits = 2
-
-
-class Str3(UTF8String):
-    _num_bits = 3
-
-
-class Str4(UTF8String):
-    _num_bits = 4
-
-
-class Str5(UTF8String):
-    _num_bits = 5
-
-
-class Str6(UTF8String):
-    _num_bits = 6
-
-
-class Str7(UTF8String):
-    _num_bits = 7
-
-
-class Str8(UTF8String):
-    _num_bits = 8
-
-
-class Str9(UTF8String):
-    _num_bits = 9
-
-
-class Str10(UTF8String):
-    _num_bits = 10
-
-
-class Str11(UTF8String):
-    _num_bits = 11
-
-
-class Str12(UTF8String):
-    _num_bits = 12
-
-
-class Str13(UTF8String):
-    _num_bits = 13
-
-
-class Str14(UTF8String):
-    _num_bits = 14
-
-
-class Str15(UTF8String):
-    _num_bits = 15
-
-
-class Str16(UTF8String):
-    _num_bits = 16
+    __slots__ = ()
 
+    encoding_name = "utf-8"
 
-class Str32(UTF8String):
-    _num_bits = 32
+    # The "utf-8" literal hits CPython's built-in UTF-8 fast paths,
+    #   which skip the codec machinery altogether
+    @classmethod
+    def encoding(cls, value: str) -> BitVector:
+        if len(value) <= _MAX_CACHED_ENCODING_LEN:
+            return cls._cached_encoding(value)
+        return BitVector(value.encode("utf-8"))
 
+    @classmethod
+    def decoding(cls, bits: BitVector) -> str:
+        return str(bits if not bits.padbits else bits.tobytes(), "utf-8")
 
-class Str64(UTF8String):
-    _num_bits = 64
+    @classmethod
+    def _decode_joined(cls, bits_list: List[BitVector]) -> str:
+        # Whole-byte strings are joined as bytes and decoded in a single call
+        if cls.num_bits % 8:
+            return super()._decode_joined(bits_list)
+        return str(_BATCH_SEPARATOR.encode().join(bits_list), "utf-8")
 
+    def __class_getitem__(cls, num_bits_: int):
+        """
+        Returns the subclass of this class with the specified number of bits,
+            e.g. `UTF8String[8]` is `Str8`, and `MyString[8]` is `MyString8`.
 
-class Str128(UTF8String):
-    _num_bits = 128
+        Args:
+            num_bits_ (int): The number of bits in strings of this type.
 
+        Returns:
+            type[UTF8String]: The subclass with the specified number of bits.
+        """
+        # UTF8String's own specializations keep their short, predefined names
+        name_prefix = "Str" if cls is UTF8String else cls.__name__
+        return cls.specialize(num_bits_, f"{name_prefix}{num_bits_}")
 
-class Str256(UTF8String):
-    _num_bits = 256
 
+_PREDEFINED_NUM_BITS = (*range(1, 17), 32, 64, 128, 256, 512)
 
-class Str512(UTF8String):
-    _num_bits = 512
+# The pre-defined subclasses (Str1, Str2, ...) are memoized specializations
+for _num_bits in _PREDEFINED_NUM_BITS:
+    globals()[f"Str{_num_bits}"] = UTF8String[_num_bits]
+del _num_bits
 
 
-__all__ = [
-    "String",
-    "StandardEncodingString",
-    "UTF8String",
-    "Str1",
-    "Str2",
-    "Str3",
-    "Str4",
-    "Str5",
-    "Str6",
-    "Str7",
-    "Str8",
-    "Str9",
-    "Str10",
-    "Str11",
-    "Str12",
-    "Str13",
-    "Str14",
-    "Str15",
-    "Str16",
-    "Str32",
-    "Str64",
-    "Str128",
-    "Str256",
-    "Str512",
+__all__ = ["String", "StandardEncodingString", "UTF8String"] + [
+    f"Str{num_bits}" for num_bits in _PREDEFINED_NUM_BITS
 ]
@@ -303,6 +303,8 @@ class BitVector(MutableSequence[Literal[0, 1]], BitsCastable):
     @classmethod
     def from_int(cls, integer: int, size: Optional[int] = None): ...
     @classmethod
+    def from_uint(cls: type[_Self], value: int, width: int) -> _Self: ...
+    @classmethod
     def from_bytes(cls, byte_arr: bytes, reverse_endianness: bool = False): ...
     def to_bytes(self, reverse_endianness: bool = False) -> bytes: ...
     def to_int(
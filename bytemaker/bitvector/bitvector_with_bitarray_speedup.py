@@ -5,7 +5,7 @@ import math
 from typing import TYPE_CHECKING, cast, overload
 
 from bitarray import bitarray
-from bitarray.util import ba2base, base2ba
+from bitarray.util import ba2base, ba2int, base2ba, int2ba
 
 from bytemaker.utils import twos_complement_bit_length
 
@@ -164,6 +164,15 @@ class BitVector(bitarray, MutableSequence[LaxLiteral01]):
         elif isinstance(source, bitarray):
             self: Self = super().__new__(cls, source)  # type: ignore[reportCallIssue]
             return self
+        # Bytes constructor
+        # Checked before the (slow, runtime Protocol) BitsCastable check
+        #   since bytes can't be BitsCastable
+        elif type(source) is bytes or type(source) is bytearray:
+            self: Self = super().__new__(
+                cls,
+                buffer=memoryview(source),  # type: ignore[reportCallIssue]
+            )
+            return self
         # BitsCastable constructor
         elif isinstance(source, BitsCastable):
             curinstance = source.__Bits__()
@@ -418,14 +427,7 @@ class BitVector(bitarray, MutableSequence[LaxLiteral01]):
         """
         if isinstance(encoding, str):
             char_array_as_bytes: bytes = char_array.encode(encoding)
-
-            retval = cls(buffer=char_array_as_bytes)
-
-            # retval.frombytes()
-            print("using standard encoding...")
-            # print(char_array.encode(encoding))
-            print("retval", retval)
-            return retval
+            return cls(buffer=char_array_as_bytes)
         else:
             bitarray_list: list[cls] = []
             substring = ""
@@ -859,7 +861,10 @@ class BitVector(bitarray, MutableSequence[LaxLiteral01]):
             return cast(Literal[0, 1], retval)
         elif isinstance(key, slice):
             retval = super().__getitem__(key)  # type: ignore[ReportAbstractUsage]
-            return type(self)(retval)
+            # bitarray already slices into an instance of type(self); avoid a copy
+            if type(retval) is not type(self):
+                retval = type(self)(retval)
+            return retval
         elif isinstance(key, Iterable):
             retval = type(self)([self[i] for i in key])
             return retval
@@ -912,26 +917,14 @@ class BitVector(bitarray, MutableSequence[LaxLiteral01]):
         Get a string representation of the BitVector.
             This is e.g. "type(self)('010.....')".
         """
-        zerosandones = self.to01()
-        # chunk the list into 8-bit chunks
-        zeroesandoneslist = [
-            zerosandones[i : i + 8] for i in range(0, len(zerosandones), 8)
-        ]
-        # join the chunks with spaces
-        return f"{type(self).__name__}" f"('{' '.join(zeroesandoneslist)}')"
+        return f"{type(self).__name__}('{self.to01(sep=' ')}')"
 
     def __repr__(self) -> str:
         """
         Get a reconstructible representation of the BitVector.
             This is e.g. "type(self)('010.....')".
         """
-        zerosandones = self.to01()
-        # chunk the list into 8-bit chunks
-        zeroesandoneslist = [
-            zerosandones[i : i + 8] for i in range(0, len(zerosandones), 8)
-        ]
-        # join the chunks with spaces
-        return f"{type(self).__name__}" f"('{' '.join(zeroesandoneslist)}'" f")"
+        return f"{type(self).__name__}('{self.to01(sep=' ')}')"
 
     def __bytes__(self) -> bytes:
         """
@@ -1659,10 +1652,27 @@ class BitVector(bitarray, MutableSequence[LaxLiteral01]):
 
         return cls(bitlist)
 
+    @classmethod
+    def from_uint(cls, value: int, width: int) -> Self:
+        """
+        Converts a non-negative integer to a BitVector of exactly `width` bits,
+            without going through a binary string.
+
+        Args:
+            value (int): The unsigned integer to convert.
+            width (int): The number of bits in the resulting BitVector.
+
+        Returns:
+            Self: The big-endian, zero-padded bits of `value`.
+        """
+        if value < 0 or value.bit_length() > width:
+            raise ValueError(f"Cannot convert {value} to an unsigned {width}-bit value")
+        return cls(int2ba(value, length=width, endian="big"))
+
     @classmethod
     def from_bytes(cls, byte_arr: bytes, reverse_endianness=False):
         if reverse_endianness:
-            byte_arr = bytes(reversed(byte_arr))
+            byte_arr = byte_arr[::-1]
 
         return cls(byte_arr)
 
@@ -1680,17 +1690,18 @@ class BitVector(bitarray, MutableSequence[LaxLiteral01]):
         return int.from_bytes(copy.to_bytes(), byteorder=endianness, signed=signed)
 
     def to_bytes(self, reverse_endianness=False) -> bytes:
-        byte_arr = bytearray()
-        for i in range(0, len(self), 8):
-            byte = 0
-            byte_end_index = min(i + 8, len(self))
+        if len(self) % 8 == 0:
+            # Byte-aligned, so bitarray can emit the bytes directly
+            byte_arr = self.tobytes()
+            return byte_arr[::-1] if reverse_endianness else byte_arr
 
-            for bit in self[i:byte_end_index]:
-                byte = (byte << 1) | bit
-            byte_arr.append(byte)
+        # The trailing partial byte is right-aligned (i.e. left-padded with 0s)
+        aligned_len = len(self) - len(self) % 8
+        byte_arr = bytearray(self[:aligned_len].tobytes())
+        byte_arr.append(ba2int(self[aligned_len:], signed=False))
 
         if reverse_endianness:
-            byte_arr = reversed(byte_arr)
+            byte_arr.reverse()
         return bytes(byte_arr)
 
 
@@ -1,5 +1,6 @@
 import ctypes
 import dataclasses
+from functools import lru_cache
 
 from bytemaker.bittypes import BitType, bytes_to_bittype
 from bytemaker.bitvector import BitVector
@@ -28,6 +29,26 @@ UnitType = Union[CType, BitType, PyType]
 # PyType is a Union of int, float, str, bytes, bool, and Enum
 
 
+@lru_cache(maxsize=None)
+def _eval_type_name(type_name: str) -> type:
+    """
+    Resolves a string type annotation to the type it names.
+    Results are memoized, so each distinct annotation is only evaluated once.
+    """
+    return eval(type_name)
+
+
+def _resolve_field_type(field: dataclasses.Field) -> type:
+    """
+    Function to get the type of a dataclass field,
+        resolving string (postponed) annotations.
+    """
+    field_type = field.type
+    if isinstance(field_type, str):
+        return _eval_type_name(field_type)
+    return field_type
+
+
 def count_bits_in_unit_type(unit_type: UnitType) -> int:
     """
     Function to count the number of bits in a UnitType-\
@@ -45,10 +66,7 @@ def count_bits_in_unit_type(unit_type: UnitType) -> int:
     elif is_subclass_of_union(unit_type, DataClassType):
         size_in_bits = 0
         for field in dataclasses.fields(unit_type):
-            field_type = field.type
-            if isinstance(field_type, str):
-                field_type = eval(field_type)
-            size_in_bits += count_bits_in_unit_type(field_type)
+            size_in_bits += count_bits_in_unit_type(_resolve_field_type(field))
         return size_in_bits
 
 
@@ -63,10 +81,7 @@ def count_bits_in_aggregate_type(aggregate_type: type) -> int:
     else:
         size_in_bits = 0
         for field in dataclasses.fields(aggregate_type):
-            field_type = field.type
-            if isinstance(field_type, str):
-                field_type = eval(field_type)
-            size_in_bits += count_bits_in_unit_type(field_type)
+            size_in_bits += count_bits_in_unit_type(_resolve_field_type(field))
         return size_in_bits
 
 
@@ -225,10 +240,7 @@ def to_bits_aggregate(convertible_object: AggregateTypeByteConvertible) -> BitVe
     elif isinstance(convertible_object, DataClassType):
         fields = dataclasses.fields(convertible_object)
         field_values = [getattr(convertible_object, field.name) for field in fields]
-        field_types = [
-            field.type if not isinstance(field.type, str) else eval(field.type)
-            for field in fields
-        ]
+        field_types = [_resolve_field_type(field) for field in fields]
         # print("types", field_types)
         # print("type_is_dataclass", [isinstance(field_type, DataClassType)
         # for field_type in field_types])
@@ -292,9 +304,7 @@ def from_bits_aggregate(
 
         read_fields = list()
         for field in dataclasses.fields(aggregate_type):
-            field_type = field.type
-            if isinstance(field.type, str):
-                field_type = eval(field.type)
+            field_type = _resolve_field_type(field)
 
             field_size_in_bits = count_bits_in_unit_type(field_type)
             field_bits = unitbits[:field_size_in_bits]
@@ -330,9 +340,7 @@ def to_bytes_aggregate(
         # print("Is dataclass", type(units))
 
         for field in dataclasses.fields(units):
-            field_type = field.type
-            if isinstance(field.type, str):
-                field_type = eval(field_type)
+            field_type = _resolve_field_type(field)
             field_value = getattr(units, field.name)
             # print(field_type)
             field_value = field_type(field_value)
@@ -412,8 +420,7 @@ def from_bytes_aggregate(
 
             read_fields = list()
             for field in dataclasses.fields(aggregate_type):
-                if isinstance(field.type, str):
-                    field_type = eval(field.type)
+                field_type = _resolve_field_type(field)
                 field_size_in_bits = count_bits_in_unit_type(field_type)
                 field_bytes = bytes_obj[:field_size_in_bits]
                 field_value = from_bytes_aggregate(
@@ -87,6 +87,15 @@ def test_bits_to_bytes(byte_bits):
     assert byte_bits.to_bytes() == b"\xa0"
 
 
+def test_bits_to_bytes_reverse_endianness():
+    bits = BitVector(b"\x01\x02\x03")
+    assert bits.to_bytes() == b"\x01\x02\x03"
+    assert bits.to_bytes(reverse_endianness=True) == b"\x03\x02\x01"
+    assert BitVector("101").to_bytes() == b"\x05"
+    assert BitVector("1111111101").to_bytes() == b"\xff\x01"
+    assert BitVector("1111111101").to_bytes(reverse_endianness=True) == b"\x01\xff"
+
+
 # Test the from_bytes class method
 def test_bits_from_bytes():
     bits = BitVector(b"\xa0")
@@ -94,6 +103,16 @@ def test_bits_from_bytes():
     assert list(bits) == bits_right
 
 
+def test_bits_from_uint():
+    assert BitVector.from_uint(5, 6) == BitVector("000101")
+    assert BitVector.from_uint(0, 3) == BitVector("000")
+    assert type(BitVector.from_uint(255, 8)) is BitVector
+    with pytest.raises(ValueError):
+        BitVector.from_uint(8, 3)
+    with pytest.raises(ValueError):
+        BitVector.from_uint(-1, 8)
+
+
 def test_bits_from_str():
     bits = BitVector("0b101")
     assert list(bits) == [1, 0, 1]
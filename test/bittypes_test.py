@@ -1,6 +1,14 @@
+import math
+import re
+import struct
+
 import pytest
 
 from bytemaker.bittypes import (
+    FP24,
+    TF19,
+    BFloat16,
+    Buffer,
     Buffer4,
     Buffer8,
     Buffer16,
@@ -9,18 +17,27 @@ from bytemaker.bittypes import (
     Float,
     Float32,
     Float64,
+    Int,
+    SInt,
     SInt8,
     SInt16,
     SInt32,
     SInt64,
     Str8,
     Str16,
+    String,
+    StructPackedBitType,
+    UInt,
     UInt8,
     UInt16,
     UInt32,
     UInt64,
+    UTF8String,
+    bittypes_to_bytes,
 )
+from bytemaker.bittypes.bittype import _source_kind, _SpecializedStructValue
 from bytemaker.bitvector import BitVector
+from bytemaker.utils import FrozenDict
 
 # from bytemaker.bittypes_old import Str8
 
@@ -217,3 +234,633 @@ def test_bit_serialization_and_deserialization(
     assert bittype_instance.to_bits() == expected_bits_length
     deserialized_value = bittype_class.from_bits(bittype_instance.to_bits()).value
     assert deserialized_value == input_value
+
+
+@pytest.mark.parametrize(
+    "bittype_class, constructor_arg",
+    [
+        (UInt8, 1),
+        (SInt16, -1),
+        (SInt.specialize(12), -1),
+        (UInt.specialize(12), 1),
+        (Float32, 1.5),
+        (BFloat16, 1.5),
+        (TF19, 1.5),
+        (Float.specialize(5, 10), 1.5),
+        (Float.specialize(8, 23, "f"), 1.5),
+        (Str8, "a"),
+        (Buffer8, BitVector("10101010")),
+        (Buffer.specialize(12), BitVector(12)),
+    ],
+)
+def test_bittype_instances_have_no_dict(bittype_class, constructor_arg):
+    bittype_instance = bittype_class(constructor_arg)
+    assert not hasattr(bittype_instance, "__dict__")
+    with pytest.raises(AttributeError):
+        bittype_instance.some_new_attribute = 1
+
+
+@pytest.mark.parametrize(
+    "bittype_class, value_1, value_2, equal",
+    [
+        (UInt8, 5, 5, True),
+        (UInt8, 5, 6, False),
+        (SInt16, -3, -3, True),
+        (Float32, 0.0, -0.0, True),
+        (Float32, float("nan"), float("nan"), True),
+        (Float64, 1.5, 2.5, False),
+        (Str8, "a", "a", True),
+    ],
+)
+def test_bittype_equality_same_type(bittype_class, value_1, value_2, equal):
+    bittype_instance_1 = bittype_class(value_1)
+    bittype_instance_2 = bittype_class(value_2)
+    assert bittype_instance_1 == bittype_instance_1
+    assert (bittype_instance_1 == bittype_instance_2) == equal
+    assert (bittype_instance_1 != bittype_instance_2) != equal
+
+
+def test_specialize_returns_cached_subclass():
+    assert SInt.specialize(12) is SInt.specialize(12)
+    assert SInt.specialize(12) is not SInt.specialize(13)
+    assert UInt.specialize(16, "H", "MyUInt16") is UInt.specialize(16, "H", "MyUInt16")
+    assert UInt.specialize(16, "H") is not UInt.specialize(16)
+    assert Buffer.specialize(3) is Buffer.specialize(3)
+    assert Float.specialize(8, 23, "f") is Float.specialize(8, 23, "f")
+    assert Float.specialize(8, 23) is not Float.specialize(8, 23, "f")
+    assert Buffer[8] is Buffer8
+    assert Buffer8.__name__ == "Buffer8" and Buffer8.num_bits == 8
+    assert UTF8String.specialize(24) is UTF8String.specialize(24)
+    assert UInt.specialize(7)(5).value == 5
+
+
+@pytest.mark.parametrize(
+    "bittype_class, num_bits",
+    [(Float32, 32), (BFloat16, 16), (TF19, 19), (Float.specialize(5, 10), 16)],
+)
+def test_float_num_bits_is_class_attribute(bittype_class, num_bits):
+    assert bittype_class.__dict__["num_bits"] == num_bits
+
+
+@pytest.mark.parametrize(
+    "bittype_class, input_value",
+    [
+        (UInt16, 513),
+        (SInt32, -7),
+        (Float64, 1.25),
+        (Str16, "ab"),
+        (Buffer8, BitVector("10101010")),
+    ],
+)
+def test_from_bytes(bittype_class, input_value):
+    bittype_instance = bittype_class(input_value)
+    from_bytes_instance = bittype_class.from_bytes(bytes(bittype_instance))
+    assert from_bytes_instance == bittype_instance
+    assert from_bytes_instance.value == bittype_instance.value
+
+
+def test_from_bytes_wrong_length():
+    with pytest.raises(ValueError):
+        UInt16.from_bytes(b"\x00")
+
+
+@pytest.mark.parametrize(
+    "bittype_class, endianness, expected_packing_format",
+    [
+        (UInt16, "big", ">H"),
+        (UInt16, "little", "<H"),
+        (SInt32, "little", "<i"),
+        (Float64, "big", ">d"),
+    ],
+)
+def test_packing_format(bittype_class, endianness, expected_packing_format):
+    bittype_instance = bittype_class(1, endianness=endianness)
+    assert bittype_instance.packing_format == expected_packing_format
+    assert bittype_class._structs[endianness].format == expected_packing_format
+
+
+def test_struct_packed_sub_byte_value():
+    uint12 = UInt.specialize(12, "H")
+    assert uint12._pad == BitVector(4)
+    assert uint12(bits=BitVector("000000000101")).value == 5
+    assert uint12(5).bits == BitVector("000000000101")
+    assert UInt16._pad is None
+
+
+def test_from_bytes_batch():
+    uint16s = UInt16.from_bytes_batch(b"\x00\x01\x00\x02\x01\x00")
+    assert [uint16.value for uint16 in uint16s] == [1, 2, 256]
+    assert all(type(uint16) is UInt16 for uint16 in uint16s)
+    assert [sint8.value for sint8 in SInt8.from_bytes_batch(b"\xff\x01")] == [-1, 1]
+    assert UInt16.from_bytes_batch(b"") == []
+    with pytest.raises(ValueError):
+        UInt16.from_bytes_batch(b"\x00\x01\x02")
+
+
+@pytest.mark.parametrize(
+    "endiannesses",
+    [("big", "big", "big"), ("little", "little", "little"), ("big", "little", "big")],
+)
+def test_bittypes_to_bytes(endiannesses):
+    bittypes = [
+        UInt16(0x0102, endianness=endiannesses[0]),
+        UInt32(0x03040506, endianness=endiannesses[1]),
+        Str8("a", endianness=endiannesses[2]),
+    ]
+    expected = b"".join(bytes(bittype) for bittype in bittypes)
+    assert bittypes_to_bytes(bittypes) == expected
+    assert bittypes_to_bytes(iter(bittypes)) == expected
+    assert bittypes_to_bytes([]) == b""
+
+
+@pytest.mark.parametrize(
+    "bittype_class, value_1, value_2",
+    [
+        (UInt8, 5, 5),
+        (Float32, 0.0, -0.0),
+        (Float32, float("nan"), float("nan")),
+        (Str8, "a", "a"),
+        (Buffer8, BitVector("10101010"), BitVector("10101010")),
+    ],
+)
+def test_equal_bittypes_hash_equal(bittype_class, value_1, value_2):
+    bittype_instance_1 = bittype_class(value_1)
+    bittype_instance_2 = bittype_class(value_2)
+    assert bittype_instance_1 == bittype_instance_2
+    assert hash(bittype_instance_1) == hash(bittype_instance_2)
+    assert len({bittype_instance_1, bittype_instance_2}) == 1
+
+
+@pytest.mark.parametrize(
+    "bittype_instance",
+    [
+        UInt16(0x0102),
+        UInt16(0x0102, endianness="little"),
+        Buffer.specialize(12)(BitVector("101010101010")),
+    ],
+)
+def test_bittype_buffer(bittype_instance):
+    assert bytes(bittype_instance.__buffer__(0)) == bytes(bittype_instance)
+
+
+@pytest.mark.parametrize("input_value", [0.0, 1.5, -2.25, float("inf")])
+def test_struct_packed_float_specialization(input_value):
+    float32_like = Float.specialize(8, 23, "f")
+    assert float32_like(input_value).value == input_value
+    assert float32_like(input_value).bits == Float32(input_value).bits
+
+
+@pytest.mark.parametrize("input_value", [1.5, -2.25, 0.1, 65504.0])
+def test_generic_float_value(input_value):
+    # Not struct-packed, but IEEE-shaped, so these still go through struct;
+    #   TF19 decodes through the generic Float getter
+    float16_like = Float.specialize(5, 10)
+    assert (
+        float16_like(input_value).value
+        == struct.unpack(">e", struct.pack(">e", input_value))[0]
+    )
+    tf19 = TF19(input_value)
+    assert tf19.value == Float.__dict__["value"].fget(tf19)
+
+
+@pytest.mark.parametrize(
+    "input_value", [1e-40, -1e-45, float("inf"), -float("inf"), 1e39, -1e39]
+)
+def test_ieee_shaped_float_specialization_special_values(input_value):
+    float32_like = Float.specialize(8, 23)
+    # Values beyond float32's range saturate to infinity
+    expected = math.copysign(math.inf, input_value)
+    if abs(input_value) < 1e38:
+        expected = struct.unpack(">f", struct.pack(">f", input_value))[0]
+        assert float32_like(input_value).bits == Float32(input_value).bits
+    assert float32_like(input_value).value == expected
+    assert math.isnan(float32_like(float("nan")).value)
+
+
+@pytest.mark.parametrize(
+    "input_value, expected_value",
+    [
+        (0.0, 0.0),
+        (-2.5, -2.5),
+        (3.14159, 3.140625),
+        (1.00390625, 1.0),  # tie, rounds to even
+        (1.01171875, 1.015625),  # tie, rounds to even
+        (1e39, float("inf")),
+    ],
+)
+def test_bfloat16_value(input_value, expected_value):
+    bfloat16 = BFloat16(input_value)
+    assert bfloat16.value == expected_value
+    assert bytes(bfloat16) + b"\x00\x00" == bytes(Float32(expected_value))
+
+
+@pytest.mark.parametrize(
+    "input_value",
+    [
+        *[1.0, -7.25, 0.1, 1 / 3, 3.4e38, 1.2e-38, 16777217.0, 0.0, -0.0],
+        *[math.inf, -math.inf, 1e-40, -5.9e-39, 1e-46, -1e-300],
+    ],
+)
+def test_float_to_binstring_matches_ieee(input_value):
+    # 16777217.0 is a tie between two float32s, and rounds to even
+    float32_bits = Float32(input_value).bits.to01()
+    assert Float.to_binstring(input_value, 8, 23) == float32_bits
+    assert Float.to_binstring_int(input_value, 8, 23) == int(float32_bits, 2)
+
+
+@pytest.mark.parametrize("input_value", [3.5e38, -1e300])
+def test_float_to_binstring_overflows_to_infinity(input_value):
+    infinity = math.copysign(math.inf, input_value)
+    assert Float.to_binstring(input_value, 8, 23) == Float32(infinity).bits.to01()
+
+
+@pytest.mark.parametrize(
+    "input_value, expected_bits",
+    [
+        (1e300, "0" + "1" * 8 + "0" * 10),
+        (-1e300, "1" + "1" * 8 + "0" * 10),
+        (1e-300, "0" * 19),
+        (-1e-300, "1" + "0" * 18),
+    ],
+)
+def test_generic_float_setter_saturates_out_of_range_values(input_value, expected_bits):
+    assert TF19(input_value).bits == BitVector(expected_bits)
+
+
+def test_float_to_binstring_nan():
+    assert Float.to_binstring(math.nan, 8, 23) == Float32(math.nan).bits.to01()
+    assert Float.to_binstring(math.nan, 5, 10) == "0111111000000000"
+
+
+@pytest.mark.parametrize("bittype_class", [Float32, Float64, BFloat16, TF19])
+@pytest.mark.parametrize("endianness", ["big", "little"])
+def test_float_bytes_array(bittype_class, endianness):
+    values = [1.5, -2.25, 0.375, 1024.0]
+    the_bytes = bittype_class.to_bytes_array(values, endianness)
+    assert bittype_class.from_bytes_array(the_bytes, endianness) == values
+    # Only struct-packed scalars store little-endian bits in little-endian order
+    if bittype_class.num_bits % 8 == 0 and (
+        endianness == "big" or issubclass(bittype_class, StructPackedBitType)
+    ):
+        expected = [
+            bittype_class.from_bytes(
+                the_bytes[i : i + bittype_class.num_bits // 8], endianness
+            ).value
+            for i in range(0, len(the_bytes), bittype_class.num_bits // 8)
+        ]
+        assert expected == values
+    assert bittype_class.to_bytes_array([]) == b""
+
+
+def test_bfloat16_bytes_array_matches_scalar():
+    values = [1.0 + 2**-8, -(1.0 + 3 * 2**-8), 1e39, -1e39, math.inf, 1e-40]
+    the_bytes = BFloat16.to_bytes_array(values)
+    assert the_bytes == b"".join(bytes(BFloat16(value)) for value in values)
+    assert BFloat16.from_bytes_array(the_bytes) == [
+        BFloat16(value).value for value in values
+    ]
+    assert math.isnan(BFloat16.from_bytes_array(BFloat16.to_bytes_array([math.nan]))[0])
+
+
+@pytest.mark.parametrize("bittype_class", [BFloat16, TF19])
+def test_float_accepts_int_values(bittype_class):
+    bittype = bittype_class(1.5)
+    bittype.value = 3
+    assert bittype.value == 3.0
+    bittype.value = True
+    assert bittype.value == 1.0
+    assert (bittype_class(1.5) + 2).value == 3.5
+    with pytest.raises(TypeError):
+        bittype.value = "1.5"
+
+
+@pytest.mark.parametrize(
+    "value, signed, bin_format, expected_length",
+    [
+        (0, False, None, 1),
+        (255, False, None, 8),
+        (256, False, None, 9),
+        ((1 << 64) + 1, False, None, 65),
+        (2**53 - 1, False, None, 53),
+        (0, True, None, 1),
+        (127, True, None, 8),
+        (-128, True, None, 8),
+        (-129, True, None, 9),
+        (-1, True, None, 1),
+        (-2, True, None, 2),
+        (2, True, None, 3),
+        (-(1 << 64), True, None, 65),
+        ((1 << 64) + 1, True, None, 66),
+        (-127, True, "signed_magnitude", 8),
+        (-127, True, "ones_complement", 8),
+    ],
+)
+def test_int_min_bit_length(value, signed, bin_format, expected_length):
+    assert (
+        Int.min_bit_length(value, signed=signed, bin_format=bin_format)
+        == expected_length
+    )
+
+
+@pytest.mark.parametrize(
+    "rep_format", ["twos_complement", "signed_magnitude", "ones_complement"]
+)
+@pytest.mark.parametrize("value", [0, 1, -1, 100, -100, 2**200 + 3, -(2**200 + 3)])
+def test_int_bit_conversions_round_trip(rep_format, value):
+    bitstring = Int.to_bitstring(value, bit_length=256, rep_format=rep_format)
+    assert len(bitstring) == 256
+    assert Int.to_bitvector(value, bit_length=256, rep_format=rep_format) == (
+        BitVector(bitstring)
+    )
+    assert Int.to_pyint(bitstring, signed=True, bin_format=rep_format) == value
+    assert Int.to_pyint(BitVector(bitstring), bin_format=rep_format) == value
+
+
+def test_string_codepoint_changes():
+    class SubstitutedStr16(Str16):
+        __slots__ = ()
+        _codepoint_changes = FrozenDict({"a": "b", "c": "d"})
+
+    assert SubstitutedStr16.codepoint_changes == {"a": "b", "c": "d"}
+    assert SubstitutedStr16._cp_fwd_state[0] == {ord("a"): "b", ord("c"): "d"}
+    bittype = SubstitutedStr16("bd")
+    assert bittype.bits == BitVector(b"ac")
+    assert bittype.value == "bd"
+
+    bittype.codepoint_changes = {"a": "e"}
+    assert SubstitutedStr16.codepoint_changes == {"a": "e"}
+    assert SubstitutedStr16("ed").bits == BitVector(b"ad")
+    assert Str16.codepoint_changes is None
+
+
+@pytest.mark.parametrize(
+    "int_format", ["twos_complement", "signed_magnitude", "ones_complement"]
+)
+@pytest.mark.parametrize("value", [0, 1, -1, 5, -5, 2047, -2047])
+def test_sint_value_unaligned_width(int_format, value):
+    bittype = SInt.specialize(12)(value, int_format=int_format)
+    assert len(bittype.bits) == 12
+    assert bittype.value == value
+    assert Int._bits_to_twos_int(SInt.specialize(12)(value).bits) == value
+
+
+def test_predefined_classes_are_specializations():
+    assert SInt[8] is SInt8 and SInt8.__name__ == "SInt8"
+    assert UInt[16] is UInt16 and UInt16.packing_format_letter == "H"
+    assert UInt[12].__name__ == "UInt12" and UInt[12].num_bits == 12
+    assert UTF8String[8] is Str8 and Str16.__name__ == "Str16"
+    assert issubclass(SInt64, StructPackedBitType)
+    assert not issubclass(SInt[12], StructPackedBitType)
+
+
+def test_struct_packed_sint_other_int_format():
+    bittype = SInt8(-3, int_format="ones_complement")
+    assert bittype.bits == BitVector("11111100")
+    assert bittype.value == -3
+
+
+def test_string_multichar_codepoint_changes():
+    class SubstitutedStr24(UTF8String[24]):
+        __slots__ = ()
+        _codepoint_changes = FrozenDict({"ab": "c"})
+
+    assert SubstitutedStr24._cp_fwd_state[0] is None
+    assert SubstitutedStr24(bits=BitVector(b"abx")).value == "cx"
+    assert SubstitutedStr24("cx").bits == BitVector(b"abx")
+    assert SubstitutedStr24._cp_fwd_state[2] == {"a"}
+    assert SubstitutedStr24(bits=BitVector(b"xyz")).value == "xyz"
+
+    SubstitutedStr24("cx").codepoint_changes = FrozenDict({"a": "b"})
+    assert "_cp_fwd_state" in vars(SubstitutedStr24)
+    assert SubstitutedStr24._cp_fwd_state[2] == frozenset()
+
+
+@pytest.mark.parametrize(
+    "source, expected_value",
+    [
+        ("1101", -3),
+        (BitVector("1101"), -3),
+        (b"\xfd", -3),
+        (bytearray(b"\xfd"), -3),
+        ([1, 1, 0, 1], -3),
+        (SInt8(-3), -3),
+        (UInt8(253), -3),
+    ],
+)
+def test_int_to_pyint_sources(source, expected_value):
+    assert Int.to_pyint(source, signed=True) == expected_value
+
+
+def test_int_to_pyint_unsupported_source():
+    with pytest.raises(TypeError):
+        Int.to_pyint(1.5)
+
+
+@pytest.mark.parametrize("value", [0, 5, 2**12 - 1])
+def test_uint_value_unaligned_width(value):
+    bittype = UInt.specialize(12)(value)
+    assert len(bittype.bits) == 12
+    assert bittype.value == value
+    with pytest.raises(ValueError):
+        bittype.value = 2**12
+    with pytest.raises(ValueError):
+        bittype.value = -1
+
+
+def test_int_ranges_are_class_attributes():
+    assert (SInt8._min_twos, SInt8._max_twos) == (-128, 127)
+    assert UInt[12]._max_uns == 2**12 - 1
+    with pytest.raises(ValueError):
+        SInt.specialize(12)(2**11)
+
+
+def test_string_overlapping_codepoint_changes_prefer_longest_key():
+    class SubstitutedStr32(UTF8String[32]):
+        __slots__ = ()
+        _codepoint_changes = FrozenDict({"a": "1", "ab": "2", "abc": "3"})
+
+    assert SubstitutedStr32(bits=BitVector(b"abca")).value == "31"
+    assert SubstitutedStr32(bits=BitVector(b"abab")).value == "22"
+
+
+def test_standard_encoding_string_reuses_cached_encodings():
+    assert Str16("ab").bits is Str16("ab").bits
+    assert Str8("a").bits == BitVector(b"a")
+    long_value = "x" * 300
+    assert UTF8String[2400](long_value).bits == BitVector(long_value.encode())
+
+
+@pytest.mark.parametrize("bittype_class", [SInt32, SInt64, UInt32, UInt64])
+def test_struct_packed_int_value_is_specialized(bittype_class):
+    assert isinstance(bittype_class.__dict__["value"], _SpecializedStructValue)
+    bittype = bittype_class(5)
+    bittype.value = 7
+    assert bittype.value == 7
+    assert bittype.bits == BitVector.from_uint(7, bittype_class.num_bits)
+
+
+def test_struct_packed_sint_value_falls_back_for_other_int_formats():
+    bittype = SInt64(-3, int_format="signed_magnitude")
+    assert bittype.bits == BitVector("1" + "0" * 61 + "11")
+    assert bittype.value == -3
+
+
+def test_string_decoding_reads_unaligned_bits():
+    aligned = BitVector(b"hi")
+    assert Str16(bits=aligned).value == "hi"
+
+    unaligned = BitVector(b"A")[:7]
+    assert unaligned.padbits
+    assert UTF8String[7].decoding(unaligned) == unaligned.tobytes().decode("utf-8")
+
+
+def test_utf8_string_encoding_matches_codec():
+    for text in ("", "héllo", "ü" * 300):
+        bits = UTF8String.encoding(text)
+        assert bits == BitVector(text.encode("utf-8"))
+        assert UTF8String.decoding(bits) == text
+
+
+def test_string_values_batch():
+    class SubstitutedStr16(Str16):
+        __slots__ = ()
+        _codepoint_changes = FrozenDict({"a": "b"})
+
+    class MultiSubstitutedStr16(Str16):
+        __slots__ = ()
+        _codepoint_changes = FrozenDict({"ab": "c"})
+
+    for cls in (Str16, SubstitutedStr16, MultiSubstitutedStr16):
+        instances = [cls(bits=BitVector(b)) for b in (b"ab", b"ba", b"zz")]
+        assert cls.values_batch(instances) == [i.value for i in instances]
+        # Strings containing the separator are read one by one
+        instances.append(cls(bits=BitVector(b"\x1fa")))
+        assert cls.values_batch(instances) == [i.value for i in instances]
+
+    Str4 = UTF8String[4]
+    instances = [Str4(bits=BitVector("0100")), Str4(bits=BitVector("0011"))]
+    assert Str4.values_batch(instances) == [i.value for i in instances]
+    assert Str16.values_batch([]) == []
+
+
+def test_string_perform_codepoint_substitution():
+    changes = FrozenDict({"ab": "c", "d": "ef"})
+    regex = re.compile("ab|d")
+    assert String.perform_codepoint_substitution("xabd", changes, regex) == "xcef"
+    assert Str8("a").perform_codepoint_substitution("d", changes, regex) == "ef"
+
+
+@pytest.mark.parametrize("bittype_class", [SInt8, SInt.specialize(12)])
+def test_sint_arithmetic(bittype_class):
+    assert (bittype_class(3) + 1).value == 4
+    assert (1 + bittype_class(3)).value == 4
+    assert (bittype_class(3) * 2).value == 6
+    assert (bittype_class(3) - bittype_class(5)).value == -2
+    assert type(bittype_class(3) + 1) is bittype_class
+
+
+@pytest.mark.parametrize("int_format", ["signed_magnitude", "ones_complement"])
+def test_sint_arithmetic_keeps_int_format(int_format):
+    result = SInt8(-3, int_format=int_format) - 1
+    assert result.int_format == int_format
+    assert result.value == -4
+    assert result.bits == SInt8(-4, int_format=int_format).bits
+
+
+def test_bittype_eq_same_bits_different_endianness():
+    big = UInt16(bits=BitVector(b"\x01\x00"), endianness="big")
+    little = UInt16(bits=BitVector(b"\x01\x00"), endianness="little")
+    assert big.value != little.value
+    assert big != little
+    assert big == UInt16(bits=BitVector(b"\x01\x00"), endianness="big")
+
+
+def test_bittype_eq_same_bits_different_int_format():
+    twos = SInt8(-3)
+    ones = SInt8(bits=BitVector(twos.bits), int_format="ones_complement")
+    assert ones.value == -2
+    assert twos != ones
+    assert ones == SInt8(-2, int_format="ones_complement")
+    assert hash(ones) == hash(SInt8(-2))
+
+
+@pytest.mark.parametrize("bittype_class", [SInt8, SInt.specialize(12)])
+def test_sint_twos_complement_range_boundaries(bittype_class):
+    num_bits = bittype_class.num_bits
+    min_value, max_value = bittype_class._min_twos, bittype_class._max_twos
+    assert (min_value, max_value) == (-(1 << (num_bits - 1)), (1 << (num_bits - 1)) - 1)
+
+    assert bittype_class(min_value).bits == BitVector("1" + "0" * (num_bits - 1))
+    assert bittype_class(min_value).value == min_value
+    assert bittype_class(max_value).bits == BitVector("0" + "1" * (num_bits - 1))
+    assert bittype_class(max_value).value == max_value
+    assert bittype_class(-1).bits == BitVector("1" * num_bits)
+    with pytest.raises((ValueError, struct.error)):
+        bittype_class(min_value - 1)
+    with pytest.raises((ValueError, struct.error)):
+        bittype_class(max_value + 1)
+
+
+@pytest.mark.parametrize("bittype_class", [TF19, FP24])
+@pytest.mark.parametrize("input_value", [0.0, -0.0, math.inf, -math.inf, 1.5, -2.25])
+def test_generic_float_special_values_round_trip(bittype_class, input_value):
+    value = bittype_class(input_value).value
+    assert value == input_value
+    assert math.copysign(1.0, value) == math.copysign(1.0, input_value)
+    assert Float.__dict__["value"].fget(bittype_class(input_value)) == value
+
+
+@pytest.mark.parametrize("bittype_class", [TF19, FP24])
+def test_generic_float_nan_and_subnormal_round_trip(bittype_class):
+    assert math.isnan(bittype_class(math.nan).value)
+    smallest_subnormal = math.ldexp(
+        1.0,
+        2
+        - (1 << (bittype_class.num_exponent_bits - 1))
+        - bittype_class.num_mantissa_bits,
+    )
+    assert bittype_class(smallest_subnormal).value == smallest_subnormal
+    assert bittype_class(3 * smallest_subnormal).value == 3 * smallest_subnormal
+
+
+@pytest.mark.parametrize(
+    "bits_int", [0, 1, 0x007FFFFF, 0x00800000, 0x3F800000, 0x7F7FFFFF, 0xFF800000]
+)
+def test_float_binstring_int_decoder_matches_ieee(bits_int):
+    expected = struct.unpack(">f", bits_int.to_bytes(4, "big"))[0]
+    assert Float.specialize(8, 23)._decode_binstring_int(bits_int) == expected
+    assert Float.specialize(8, 23, "f")._decode_binstring_int(bits_int) == expected
+
+
+def test_bfloat16_little_endian():
+    values = [1.5, -2.25, math.inf]
+    little_bytes = BFloat16.to_bytes_array(values, "little")
+    big_bytes = BFloat16.to_bytes_array(values, "big")
+    assert little_bytes[0::2] == big_bytes[1::2]
+    assert little_bytes[1::2] == big_bytes[0::2]
+    assert BFloat16.from_bytes_array(little_bytes, "little") == values
+    # Scalar BFloat16s keep big-endian bits, like the other generic Floats
+    assert BFloat16(1.5, endianness="little").bits == BFloat16(1.5).bits
+
+
+def test_named_float_specialization_qualname():
+    named = Float.specialize(6, 9, name_="Float16E6")
+    assert named.__name__ == named.__qualname__ == "Float16E6"
+    assert repr(named).endswith(".Float16E6'>")
+
+
+def test_utf8_string_subclass_getitem_name():
+    class ShoutingString(UTF8String):
+        __slots__ = ()
+
+    assert ShoutingString[16].__name__ == ShoutingString[16].__qualname__
+    assert ShoutingString[16].__name__ == "ShoutingString16"
+    assert issubclass(ShoutingString[16], ShoutingString)
+    assert UTF8String[16] is Str16
+
+
+def test_source_kind_cache_is_bounded():
+    assert _source_kind.cache_info().maxsize is not None
+    assert _source_kind(SInt8) == "bittype"
+    assert _source_kind(BitVector) == "bits"
+    assert _source_kind(int) == "value"